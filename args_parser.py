@@ -21,15 +21,50 @@ def parse_arguments():
                        help='Fator de bias para movimento dos humanos (padrão: 0.6, entre 0.0 e 1.0)')
     parser.add_argument('--no-human-bias', action='store_true',
                        help='Desabilita movimento preferencial dos humanos')
+    parser.add_argument('--human-strategy', type=str, default='DIRECIONAL',
+                       choices=['DIRECIONAL', 'FUGA'],
+                       help='Estratégia de movimento dos humanos: DIRECIONAL (bias para a direita) ou FUGA (rota mais segura até a saída) (padrão: DIRECIONAL)')
     parser.add_argument('--zombie-strategy', type=str, default='ALEATORIO',
                        choices=['ALEATORIO', 'PERSEGUICAO', 'BLOQUEIO'],
                        help='Estratégia de movimento dos zumbis (padrão: ALEATORIO)')
     parser.add_argument('--zombie-range', type=int, default=3,
                        help='Distância máxima para perseguição dos zumbis (padrão: 3)')
+    parser.add_argument('--neighbourhood', type=str, default='ORTOGONAL',
+                       choices=['ORTOGONAL', 'MOORE'],
+                       help='Vizinhança usada em movimentos e contaminações: ORTOGONAL (4 vizinhos) ou MOORE (8 vizinhos, com diagonais) (padrão: ORTOGONAL)')
+    parser.add_argument('--toroidal', action='store_true',
+                       help='Conecta a borda superior à inferior do tabuleiro; a horizontal continua limitada pela saída')
     parser.add_argument('--display-rate', type=float, default=0.5,
                        help='Taxa de atualização da tela em segundos (padrão: 0.5)')
+    parser.add_argument('--view-mode', type=str, default='COMPLETO',
+                       choices=['COMPLETO', 'JANELA', 'ZOOM'],
+                       help='Modo de exibição: tabuleiro completo, janela seguindo o humano mais avançado ou zoom por densidade (padrão: COMPLETO)')
+    parser.add_argument('--zoom-factor', type=int, default=0,
+                       help='Casas agregadas por célula (KxK) no modo ZOOM, 0 = ajusta ao terminal (padrão: 0)')
     parser.add_argument('--enable-realtime-logger', action='store_true',
                        help='Habilita exibição de logs em tempo real durante a execução (padrão: desabilitado)')
+    parser.add_argument('--shared-state', action='store_true',
+                       help='Publica o tabuleiro e os contadores em memória compartilhada para observadores em outros processos')
+    parser.add_argument('--display-process', action='store_true',
+                       help='Executa a exibição em um processo separado, lendo o estado da memória compartilhada')
+    parser.add_argument('--headless', action='store_true',
+                       help='Executa sem exibir o tabuleiro e sem contagem regressiva, apenas com as estatísticas finais (implica --fast-start)')
+    parser.add_argument('--fast-start', action='store_true',
+                       help='Distribui o primeiro movimento de cada entidade ao longo de um cooldown em vez de aguardar um cooldown completo')
+    parser.add_argument('--move-arbiter', action='store_true',
+                       help='Entidades enviam intenções de movimento a uma thread árbitro que as resolve em lotes')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Quantidade de processos, cada um simulando uma faixa vertical do tabuleiro (padrão: 1 = modo com threads)')
+    parser.add_argument('--trace', type=str, default=None,
+                       help='Arquivo JSON onde a linha do tempo das threads é gravada no formato Chrome trace-event')
+    parser.add_argument('--occupancy-file', type=str, default=None,
+                       help='Arquivo onde a ocupação do tabuleiro (humanos, zumbis e esperas) é amostrada ao longo do tempo')
+    parser.add_argument('--occupancy-interval', type=float, default=0.1,
+                       help='Intervalo entre amostras de ocupação em segundos (padrão: 0.1)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Semente do gerador aleatório, para reproduzir a distribuição inicial e as escolhas das entidades (padrão: aleatória)')
+    parser.add_argument('--results-db', type=str, default=None,
+                       help='Arquivo SQLite onde a configuração, as estatísticas e o resultado da partida são gravados')
     
     args = parser.parse_args()
     validate_args(args)
@@ -63,3 +98,35 @@ def validate_args(args):
     if args.game_timeout < 0:
         print("Erro: Timeout do jogo não pode ser negativo")
         sys.exit(1)
+    
+    if args.seed is not None and args.seed < 0:
+        print("Erro: Semente não pode ser negativa")
+        sys.exit(1)
+    
+    if args.zoom_factor < 0:
+        print("Erro: Fator de zoom não pode ser negativo")
+        sys.exit(1)
+    
+    if args.workers < 1 or args.board_size // args.workers < 2:
+        print(f"Erro: Quantidade de workers deve estar entre 1 e {args.board_size // 2} (cada faixa precisa de pelo menos 2 colunas)")
+        sys.exit(1)
+    
+    if args.workers > 1 and (args.shared_state or args.display_process):
+        print("Erro: Memória compartilhada e exibição em processo separado não estão disponíveis com mais de um worker")
+        sys.exit(1)
+    
+    if args.workers > 1 and args.human_strategy == 'FUGA':
+        print("Erro: A estratégia de fuga dos humanos não está disponível com mais de um worker")
+        sys.exit(1)
+    
+    if args.occupancy_interval <= 0:
+        print("Erro: Intervalo de amostragem da ocupação deve ser positivo")
+        sys.exit(1)
+    
+    if args.workers > 1 and args.occupancy_file:
+        print("Erro: A gravação de ocupação não está disponível com mais de um worker")
+        sys.exit(1)
+    
+    if args.workers > 1 and args.trace:
+        print("Erro: O trace das threads não está disponível com mais de um worker")
+        sys.exit(1)
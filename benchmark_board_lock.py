@@ -0,0 +1,147 @@
+import argparse
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from game_board import GameBoard
+from human import Human
+from zombie import Zombie
+from rw_lock import ReadWriteLock
+from board_topology import BoardTopology
+from game_statistics import GameStatistics
+from world_snapshot import WorldSnapshotPublisher
+
+ROW_SPACING = 3
+
+class ExclusiveLock:
+    # Baseline: every query and every commit serialize on one mutex, as before the reader-writer lock
+    def __init__(self):
+        self.lock = threading.Lock()
+    
+    def read(self, reader):
+        with self.lock:
+            return reader()
+    
+    @contextmanager
+    def write_locked(self):
+        with self.lock:
+            yield
+    
+    def __enter__(self):
+        self.lock.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.lock.release()
+
+def build_board(board_size, population):
+    board = GameBoard()
+    board.configure(board_size=board_size, position_wait_timeout=0.1)
+    board.topology = BoardTopology(board_size)
+    board.initialize_positions()
+    # GameBoard is a singleton, so everything a previous scenario touched is replaced
+    board.entities.clear()
+    board.statistics = GameStatistics()
+    board.snapshots = WorldSnapshotPublisher()
+    board.board_views = [board.snapshots]
+    
+    # Each row holds a single type and rows are 3 apart, so even after a writer steps one row down
+    # humans and zombies stay 2 rows apart and no commit triggers a transformation
+    for i in range(population):
+        row = i // board_size
+        x, y = i % board_size, ROW_SPACING * row
+        entity_class = Human if row % 2 == 0 else Zombie
+        entity = entity_class(x, y)
+        entity.set_game_board(board)
+        board.entities.append(entity)
+    
+    with board._board_views_batch():
+        for entity in board.entities:
+            board.snapshots.place(entity, entity.get_position())
+    return board
+
+def run_scenario(board, lock, readers, writers, duration):
+    board.board_lock = lock
+    go = threading.Event()
+    stop = threading.Event()
+    read_counts = [0] * readers
+    write_counts = [0] * writers
+    write_latencies = [0.0] * writers
+    board_size = board.board_size
+    
+    def reader(index):
+        count = 0
+        go.wait()
+        while not stop.is_set():
+            x, y = count % board_size, (count * 7) % board_size
+            board.is_position_busy(x, y)
+            board.get_nearby_entities(x, y)
+            count += 1
+        read_counts[index] = count
+    
+    def writer(index):
+        # Writers are spread over the population so both humans and zombies move
+        entity = board.entities[index * len(board.entities) // writers]
+        home = entity.get_position()
+        away = (home[0], home[1] + 1)
+        count = 0
+        latency = 0.0
+        go.wait()
+        while not stop.is_set():
+            target = away if entity.get_position() == home else home
+            started = time.perf_counter()
+            if board.move_entity(entity, *target):
+                latency += time.perf_counter() - started
+                count += 1
+        write_counts[index] = count
+        write_latencies[index] = latency
+    
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    # Threads start together so a busy lock cannot stall the launch of the remaining ones
+    go.set()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    commits = sum(write_counts)
+    return {
+        'reads': sum(read_counts) / duration,
+        'commits': commits / duration,
+        'commit_latency': sum(write_latencies) / commits if commits else 0.0,
+        'transformations': board.statistics.transformations
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de contenção do lock do tabuleiro')
+    parser.add_argument('--board-size', type=int, default=100)
+    parser.add_argument('--population', type=int, default=200)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=3.0)
+    args = parser.parse_args()
+    
+    if ROW_SPACING * -(-args.population // args.board_size) > args.board_size:
+        print(f"Erro: {args.population} entidades não cabem em um tabuleiro {args.board_size}x{args.board_size} "
+              f"com uma linha ocupada a cada {ROW_SPACING}")
+        sys.exit(1)
+    if args.writers > args.population:
+        print("Erro: o número de escritores não pode exceder a população")
+        sys.exit(1)
+    
+    print(f"Tabuleiro {args.board_size}x{args.board_size}, {args.population} entidades, "
+          f"{args.readers} leitores, {args.writers} escritores, {args.duration}s por cenário\n")
+    print(f"{'Lock':<16}{'Consultas/s':>14}{'Commits/s':>12}{'Latência commit':>18}{'Transformações':>16}")
+    
+    for name, lock in (('Exclusivo', ExclusiveLock()), ('Leitor-escritor', ReadWriteLock())):
+        # A fresh board per scenario so every writer starts from its home cell
+        board = build_board(args.board_size, args.population)
+        result = run_scenario(board, lock, args.readers, args.writers, args.duration)
+        print(f"{name:<16}{result['reads']:>14.0f}{result['commits']:>12.0f}"
+              f"{result['commit_latency'] * 1000:>15.3f} ms{result['transformations']:>16}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+NEIGHBOURHOODS = ('ORTOGONAL', 'MOORE')
+
+ORTHOGONAL_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL_OFFSETS = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+class BoardTopology:
+    def __init__(self, board_size, neighbourhood='ORTOGONAL', toroidal=False):
+        self.board_size = board_size
+        self.neighbourhood = neighbourhood
+        self.toroidal = toroidal
+        self.offsets = ORTHOGONAL_OFFSETS + (DIAGONAL_OFFSETS if neighbourhood == 'MOORE' else ())
+        
+        # Flat tables indexed by y * board_size + x, built once so moves never bounds-check
+        cells = board_size * board_size
+        self.steps = {offset: [None] * cells for offset in self.offsets}
+        self.neighbours = [()] * cells
+        self.neighbour_indices = [()] * cells
+        for y in range(board_size):
+            for x in range(board_size):
+                index = y * board_size + x
+                targets = []
+                for offset in self.offsets:
+                    target = self._wrap(x + offset[0], y + offset[1])
+                    self.steps[offset][index] = target
+                    if target is not None:
+                        targets.append(target)
+                self.neighbours[index] = tuple(targets)
+                self.neighbour_indices[index] = tuple(target_y * board_size + target_x for target_x, target_y in targets)
+    
+    def _wrap(self, x, y):
+        # Only the vertical axis wraps: the horizontal axis runs from the humans' start to the exit
+        if not 0 <= x < self.board_size:
+            return None
+        if self.toroidal:
+            return x, y % self.board_size
+        if not 0 <= y < self.board_size:
+            return None
+        return x, y
+    
+    def neighbours_of(self, x, y):
+        return self.neighbours[y * self.board_size + x]
+    
+    def step(self, x, y, dx, dy):
+        return self.steps[(dx, dy)][y * self.board_size + x]
+    
+    def distance(self, x, y, other_x, other_y):
+        dx = abs(other_x - x)
+        dy = abs(other_y - y)
+        if self.toroidal:
+            dy = min(dy, self.board_size - dy)
+        if self.neighbourhood == 'MOORE':
+            return max(dx, dy)
+        return dx + dy
@@ -0,0 +1,154 @@
+import heapq
+from contextlib import contextmanager
+from entity import EntityType
+
+STEP_COST = 1
+DANGER_COST = 8
+ZOMBIE_COST = 1000
+INFINITY = float('inf')
+
+class EscapeDistanceField:
+    def __init__(self, topology):
+        self.topology = topology
+        self.board_size = topology.board_size
+        self.neighbours = topology.neighbour_indices
+        cells = self.board_size * self.board_size
+        
+        # distances[i] is the cost of the cheapest route from cell i to the exit column, the cell's own cost included
+        self.costs = [STEP_COST] * cells
+        self.distances = [self.board_size - index % self.board_size for index in range(cells)]
+        self.parents = [None if self._is_exit(index) else index + 1 for index in range(cells)]
+        
+        self.zombies = [0] * cells
+        self.danger = [0] * cells
+        # Cell of every zombie counted in the marks, by entity id
+        self.zombie_cells = {}
+        self.dirty = set()
+        self.updated_cells = 0
+        self._write_depth = 0
+    
+    def _is_exit(self, index):
+        return index % self.board_size == self.board_size - 1
+    
+    def distance_at(self, x, y):
+        return self.distances[y * self.board_size + x]
+    
+    @contextmanager
+    def write(self):
+        self._write_depth += 1
+        try:
+            yield
+        finally:
+            self._write_depth -= 1
+            if self._write_depth == 0 and self.dirty:
+                self._update()
+    
+    def place(self, entity, position):
+        if entity.type == EntityType.ZOMBIE:
+            with self.write():
+                self._add_zombie(entity, position)
+    
+    def move(self, entity, old_position, new_position):
+        if entity.id in self.zombie_cells:
+            with self.write():
+                self._remove_zombie(entity)
+                self._add_zombie(entity, new_position)
+    
+    def transform(self, entity, position):
+        # Only a human turning into a zombie adds a mark; repeating the transform must not leave a phantom zombie
+        if entity.id not in self.zombie_cells:
+            with self.write():
+                self._add_zombie(entity, position)
+    
+    def remove(self, entity, position, escaped=False):
+        if entity.id in self.zombie_cells:
+            with self.write():
+                self._remove_zombie(entity)
+    
+    def _add_zombie(self, entity, position):
+        self.zombie_cells[entity.id] = position
+        self._mark_zombie(position, 1)
+    
+    def _remove_zombie(self, entity):
+        self._mark_zombie(self.zombie_cells.pop(entity.id), -1)
+    
+    def _mark_zombie(self, position, delta):
+        index = position[1] * self.board_size + position[0]
+        self.zombies[index] += delta
+        self.dirty.add(index)
+        for neighbour in self.neighbours[index]:
+            self.danger[neighbour] += delta
+            self.dirty.add(neighbour)
+    
+    def _cost(self, index):
+        if self.zombies[index]:
+            return ZOMBIE_COST
+        if self.danger[index]:
+            return STEP_COST + DANGER_COST
+        return STEP_COST
+    
+    def _update(self):
+        costs = self.costs
+        parents = self.parents
+        neighbours = self.neighbours
+        
+        increased = []
+        decreased = []
+        for index in self.dirty:
+            cost = self._cost(index)
+            if cost > costs[index]:
+                increased.append(index)
+            elif cost < costs[index]:
+                decreased.append(index)
+            costs[index] = cost
+        self.dirty = set()
+        
+        # Cells whose cheapest route ran through a cell that became more expensive lose their distance
+        invalid = set()
+        stack = increased
+        while stack:
+            index = stack.pop()
+            if index in invalid:
+                continue
+            invalid.add(index)
+            for neighbour in neighbours[index]:
+                if parents[neighbour] == index:
+                    stack.append(neighbour)
+        
+        # New distances are staged apart so concurrent readers only ever see complete old or new values
+        staged = dict.fromkeys(invalid, INFINITY)
+        for index in invalid:
+            parents[index] = None
+        
+        def distance(index):
+            return staged.get(index, self.distances[index])
+        
+        heap = []
+        for index in list(invalid) + decreased:
+            if self._is_exit(index):
+                best, parent = costs[index], None
+            else:
+                best, parent = INFINITY, None
+                for neighbour in neighbours[index]:
+                    candidate = costs[index] + distance(neighbour)
+                    if candidate < best:
+                        best, parent = candidate, neighbour
+            if best < distance(index):
+                staged[index] = best
+                parents[index] = parent
+                heapq.heappush(heap, (best, index))
+        
+        while heap:
+            current, index = heapq.heappop(heap)
+            if current > distance(index):
+                continue
+            for neighbour in neighbours[index]:
+                candidate = current + costs[neighbour]
+                if candidate < distance(neighbour):
+                    staged[neighbour] = candidate
+                    parents[neighbour] = index
+                    heapq.heappush(heap, (candidate, neighbour))
+        
+        for index, value in staged.items():
+            self.distances[index] = value
+        self.updated_cells += len(staged)
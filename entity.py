@@ -3,6 +3,7 @@ import time
 import random
 from abc import ABC, abstractmethod
 from enum import Enum
+from trace_recorder import TraceRecorder
 
 class EntityType(Enum):
     HUMAN = "HUMAN"
@@ -28,6 +29,7 @@ class Entity(ABC, threading.Thread):
         self.position_x = position_x
         self.position_y = position_y
         self.type = entity_type
+        self.name = f"{entity_type.value}-{self.id}"
         self.is_alive = True
         self.actual_state = EntityState.MOVING
         self.game_board = None
@@ -39,6 +41,9 @@ class Entity(ABC, threading.Thread):
     def run(self):
         from game_logger import GameLogger, LogEvent
         logger = GameLogger()
+        tracer = TraceRecorder()
+        
+        first_move = True
         
         while self.is_alive and not self.game_board.game_ended:
             try:
@@ -49,12 +54,17 @@ class Entity(ABC, threading.Thread):
                     self.game_board.cooldown_min,
                     self.game_board.cooldown_max
                 )
-                time.sleep(cooldown)
+                if first_move:
+                    cooldown = self.game_board.first_cooldown(cooldown)
+                    first_move = False
+                with tracer.span("cooldown", "entity"):
+                    time.sleep(cooldown)
                 
                 if not self.is_alive or self.game_board.game_ended:
                     break
                 
-                next_x, next_y = self.calculate_next_movement()
+                with tracer.span("decision", "entity"):
+                    next_x, next_y = self.calculate_next_movement()
                 
                 if next_x is not None and next_y is not None:
                     self.move(next_x, next_y)
@@ -101,15 +111,16 @@ class Entity(ABC, threading.Thread):
         from game_logger import GameLogger, LogEvent
         logger = GameLogger()
         
-        self.actual_state = EntityState.TRANSFORMING
-        logger.log(
-            LogEvent.TRANSFORMATION,
-            f"Human transformed at position ({self.position_x},{self.position_y})",
-            self.id,
-            "HUMAN->ZOMBIE"
-        )
-        self.type = EntityType.ZOMBIE
-        self.actual_state = EntityState.MOVING
+        with TraceRecorder().span("transformation", "entity", {'entity': self.id}):
+            self.actual_state = EntityState.TRANSFORMING
+            logger.log(
+                LogEvent.TRANSFORMATION,
+                f"Human transformed at position ({self.position_x},{self.position_y})",
+                self.id,
+                "HUMAN->ZOMBIE"
+            )
+            self.type = EntityType.ZOMBIE
+            self.actual_state = EntityState.MOVING
     
     def escape(self):
         from game_logger import GameLogger, LogEvent
@@ -123,7 +134,7 @@ class Entity(ABC, threading.Thread):
             self.type.value
         )
         self.kill()
-        self.game_board.register_escape()
+        self.game_board.register_escape(self)
     
     def kill(self):
         self.is_alive = False
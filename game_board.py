@@ -4,12 +4,23 @@ import random
 import signal
 import sys
 import os
+from contextlib import ExitStack
 from entity import EntityType, EntityState
 from human import Human
 from zombie import Zombie
 from game_logger import GameLogger, LogEvent
 from game_statistics import GameStatistics
-from game_display import GameDisplay
+from game_display import GameDisplay, GameDisplayProcess
+from shared_board_state import SharedBoardState
+from world_snapshot import WorldSnapshotPublisher
+from wait_for_graph import WaitForGraph
+from move_arbiter import MoveArbiter
+from rw_lock import ReadWriteLock
+from results_store import record_game_result
+from board_topology import BoardTopology
+from trace_recorder import TraceRecorder
+from distance_field import EscapeDistanceField
+from occupancy_recorder import OccupancyRecorder
 
 class GameBoard:
     _instance = None
@@ -33,59 +44,129 @@ class GameBoard:
             self.position_wait_timeout = 10.0
             self.human_movement_bias_enabled = True
             self.human_movement_bias = 0.6
+            self.human_movement_strategy = "DIRECIONAL"
             self.zombie_movement_strategy = "ALEATORIO"
             self.zombie_persecution_range = 3
+            self.neighbourhood = "ORTOGONAL"
+            self.toroidal = False
             self.display_update_rate = 0.5
+            self.view_mode = "COMPLETO"
+            self.zoom_factor = 0
+            self.shared_state_enabled = False
+            self.display_process = False
+            self.headless = False
+            self.fast_start = False
+            self.move_arbiter_enabled = False
+            self.trace_file = None
+            self.occupancy_file = None
+            self.occupancy_interval = 0.1
+            self.seed = None
+            self.results_db = None
+            self.configuration = {}
             
             self.entities = []
-            self.board_lock = threading.Lock()
+            self.board_lock = ReadWriteLock()
             self.position_locks = {}
             self.position_conditions = {}
+            self.position_primitives_lock = threading.Lock()
+            self.wait_for_graph = WaitForGraph()
+            self.move_arbiter = None
             self.game_ended = False
+            self.end_game_lock = threading.Lock()
+            self.game_finished = threading.Event()
             self.winner = None
             self.start_time = None
             self.show_realtime_logs = False
             
             self.logger = GameLogger()
             self.statistics = GameStatistics()
+            self.tracer = TraceRecorder()
             self.display = None
+            self.shared_state = None
+            self.topology = None
+            self.escape_field = None
+            self.occupancy_recorder = None
+            self.snapshots = WorldSnapshotPublisher()
+            self.board_views = [self.snapshots]
             
             self.initialized = True
     
     def configure(self, **kwargs):
+        self.configuration.update(kwargs)
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
     
     def initialize_positions(self):
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                self.position_locks[(x, y)] = threading.Lock()
-                self.position_conditions[(x, y)] = threading.Condition(self.position_locks[(x, y)])
+        # Per-cell primitives are created on first use by _position_condition
+        self.position_locks.clear()
+        self.position_conditions.clear()
+    
+    def _position_condition(self, position):
+        condition = self.position_conditions.get(position)
+        if condition is None:
+            with self.position_primitives_lock:
+                condition = self.position_conditions.get(position)
+                if condition is None:
+                    self.position_locks[position] = threading.Lock()
+                    condition = threading.Condition(self.position_locks[position])
+                    self.position_conditions[position] = condition
+        return condition
     
     def start_game(self):
+        self.statistics.record_launch()
+        
         # Create logs directory if it doesn't exist
         logs_dir = "logs"
-        if not os.path.exists(logs_dir):
-            os.makedirs(logs_dir)
+        os.makedirs(logs_dir, exist_ok=True)
         
         log_file_path = os.path.join(logs_dir, f"game_log_{int(time.time())}.txt")
         self.logger.initialize(log_file_path, self.show_realtime_logs)
+        self.tracer.initialize(self.trace_file is not None)
         self.logger.log(LogEvent.GAME_START, f"Game started with {self.humans_amount} humans and {self.zombies_amount} zombies")
         
+        if self.seed is None:
+            self.seed = random.randrange(2**32)
+        random.seed(self.seed)
+        self.logger.log(LogEvent.GAME_START, f"Random seed: {self.seed}")
+        
+        self.topology = BoardTopology(self.board_size, self.neighbourhood, self.toroidal)
         self.initialize_positions()
+        
+        if self.shared_state_enabled or self.display_process:
+            self.shared_state = SharedBoardState(self.board_size)
+            self.board_views.append(self.shared_state)
+            self.logger.log(LogEvent.GAME_START, f"Board state published in shared memory segment {self.shared_state.name}")
+        
+        if self.human_movement_strategy == "FUGA":
+            self.escape_field = EscapeDistanceField(self.topology)
+            self.board_views.append(self.escape_field)
+        
         self._place_entities()
         
         self.statistics.set_initial_counts(self.humans_amount, self.zombies_amount)
         
-        self.display = GameDisplay(self, self.display_update_rate)
-        self.display.start()
+        if self.display_process and not self.headless:
+            self.display = GameDisplayProcess(
+                self, self.shared_state.name, self.display_update_rate, self.view_mode, self.zoom_factor
+            )
+        else:
+            self.display = GameDisplay(self, self.display_update_rate, self.view_mode, self.zoom_factor)
+        if not self.headless:
+            self.display.start()
         
         self.start_time = time.time()
         
-        for entity in self.entities:
-            entity.set_game_board(self)
-            entity.start()
+        if self.occupancy_file:
+            self.occupancy_recorder = OccupancyRecorder(self, self.occupancy_file, self.occupancy_interval)
+            self.occupancy_recorder.start()
+        
+        if self.move_arbiter_enabled:
+            self.move_arbiter = MoveArbiter(self)
+            self.move_arbiter.start()
+        
+        self._start_entities()
+        self.statistics.record_ready()
         
         signal.signal(signal.SIGINT, self._signal_handler)
         
@@ -98,6 +179,19 @@ class GameBoard:
         
         return game_thread
     
+    def _start_entities(self):
+        for entity in self.entities:
+            entity.set_game_board(self)
+        for entity in self.entities:
+            entity.start()
+    
+    def first_cooldown(self, cooldown):
+        # Fast start spreads the first moves over one cooldown instead of waiting a full one;
+        # headless runs have no countdown to sit through, so they always start fast
+        if self.fast_start or self.headless:
+            return random.uniform(0, cooldown)
+        return cooldown
+    
     def _place_entities(self):
         available_human_positions = [(0, y) for y in range(self.board_size)]
         available_zombie_positions = [(self.board_size - 1, y) for y in range(self.board_size)]
@@ -114,11 +208,38 @@ class GameBoard:
             x, y = available_zombie_positions[i]
             zombie = Zombie(x, y)
             self.entities.append(zombie)
+        
+        with self._board_views_batch():
+            for entity in self.entities:
+                for view in self.board_views:
+                    view.place(entity, entity.get_position())
+    
+    def _board_views_batch(self):
+        # Groups every view update of a commit into a single published frame
+        batch = ExitStack()
+        for view in self.board_views:
+            batch.enter_context(view.write())
+        return batch
+    
+    def _record_move(self, entity, old_position, new_position):
+        for view in self.board_views:
+            view.move(entity, old_position, new_position)
+    
+    def _record_transformation(self, entity):
+        for view in self.board_views:
+            view.transform(entity, entity.get_position())
+    
+    def _record_removal(self, entity, escaped=False):
+        for view in self.board_views:
+            view.remove(entity, entity.get_position(), escaped)
     
     def _game_loop(self):
         while not self.game_ended:
             time.sleep(0.1)
             self.check_win_condition()
+        
+        # end_game may be running on a daemon entity or timeout thread
+        self.game_finished.wait()
     
     def _timeout_checker(self):
         time.sleep(self.game_timeout)
@@ -130,58 +251,129 @@ class GameBoard:
         self.end_game("INTERRUPTED")
         sys.exit(0)
     
+    def world_snapshot(self):
+        # Lock-free: the publisher swaps in a new immutable snapshot after each commit
+        return self.snapshots.current
+    
     def is_valid_position(self, x, y):
         return 0 <= x < self.board_size and 0 <= y < self.board_size
     
     def is_position_busy(self, x, y):
-        with self.board_lock:
+        def scan():
             for entity in self.entities:
                 if entity.is_alive and entity.position_x == x and entity.position_y == y:
                     return True
-        return False
+            return False
+        
+        return self.board_lock.read(scan)
     
     def move_entity(self, entity, new_x, new_y):
         if not self.is_valid_position(new_x, new_y):
             return False
         
+        if self.move_arbiter:
+            future = self.move_arbiter.submit(entity, new_x, new_y)
+            with self.tracer.span("commit", "board", {'target': [new_x, new_y]}):
+                return future.result()
+        
         old_x, old_y = entity.position_x, entity.position_y
         
-        with self.position_conditions[(new_x, new_y)]:
-            wait_start = time.time()
-            while self.is_position_busy(new_x, new_y):
-                if time.time() - wait_start > self.position_wait_timeout:
-                    self.statistics.record_collision()
-                    self.logger.log(
-                        LogEvent.MOVE_WAITING_TIMEOUT,
-                        f"Movement timeout waiting for position ({new_x},{new_y})",
-                        entity.id,
-                        entity.type.value
-                    )
-                    return False
-                
-                self.logger.log(
-                    LogEvent.MOVE_WAITING,
-                    f"Waiting for position ({new_x},{new_y}) to be free",
-                    entity.id,
-                    entity.type.value
-                )
-                
-                if not self.position_conditions[(new_x, new_y)].wait(timeout=0.5):
-                    if self.game_ended or not entity.is_alive:
-                        return False
+        condition = self._position_condition((new_x, new_y))
+        with condition:
+            if self.is_position_busy(new_x, new_y):
+                entity.actual_state = EntityState.WAITING
+                try:
+                    with self.tracer.span("wait", "board", {'target': [new_x, new_y]}):
+                        if not self._wait_for_position(entity, condition, new_x, new_y):
+                            return False
+                finally:
+                    # A transformation, escape or death during the wait already replaced the state
+                    if entity.actual_state == EntityState.WAITING:
+                        entity.actual_state = EntityState.MOVING
+                    self.wait_for_graph.release(entity.id)
             
-            with self.board_lock:
+            # The span covers acquiring board_lock as well as holding it, so lock handoffs show up as gaps
+            with self.tracer.span("commit", "board", {'target': [new_x, new_y]}), \
+                    self.board_lock.write_locked(), self._board_views_batch():
                 entity.position_x = new_x
                 entity.position_y = new_y
+                self._record_move(entity, (old_x, old_y), (new_x, new_y))
                 self.check_transformations(new_x, new_y)
             
             self.statistics.record_move(entity.type.value, (new_x, new_y))
         
-        with self.position_conditions[(old_x, old_y)]:
-            self.position_conditions[(old_x, old_y)].notify_all()
+        old_condition = self.position_conditions.get((old_x, old_y))
+        if old_condition is not None:
+            with old_condition:
+                old_condition.notify_all()
         
         return True
     
+    def _wait_for_position(self, entity, condition, new_x, new_y):
+        wait_start = time.time()
+        while self.is_position_busy(new_x, new_y):
+            if time.time() - wait_start > self.position_wait_timeout:
+                self.statistics.record_collision()
+                self.logger.log(
+                    LogEvent.MOVE_WAITING_TIMEOUT,
+                    f"Movement timeout waiting for position ({new_x},{new_y})",
+                    entity.id,
+                    entity.type.value
+                )
+                return False
+            
+            owner_id = self.world_snapshot().owner_at(new_x, new_y)
+            if owner_id is not None:
+                deadlock = self.wait_for_graph.wait(entity.id, owner_id, (new_x, new_y))
+                if deadlock:
+                    self._resolve_deadlock(entity, *deadlock)
+            
+            if self.wait_for_graph.is_aborted(entity.id):
+                self.statistics.record_collision()
+                return False
+            
+            self.logger.log(
+                LogEvent.MOVE_WAITING,
+                f"Waiting for position ({new_x},{new_y}) to be free",
+                entity.id,
+                entity.type.value
+            )
+            
+            if not condition.wait(timeout=0.5):
+                if self.game_ended or not entity.is_alive:
+                    return False
+        
+        return True
+    
+    def _resolve_deadlock(self, entity, victim_id, victim_position, cycle):
+        self.statistics.record_deadlock()
+        self.logger.log(
+            LogEvent.DEADLOCK_RESOLVED,
+            f"Wait-for cycle {' -> '.join(map(str, cycle + [cycle[0]]))} resolved by aborting entity {victim_id}",
+            entity.id,
+            entity.type.value
+        )
+        
+        if victim_id == entity.id:
+            return
+        
+        # Wake the victim without blocking; if its cell is busy it notices on its next wait slice
+        victim_condition = self.position_conditions.get(victim_position)
+        if victim_condition is not None and victim_condition.acquire(blocking=False):
+            try:
+                victim_condition.notify_all()
+            finally:
+                victim_condition.release()
+    
+    def _transform(self, entity):
+        # A human can be reached by several zombies in the same commit, but it only turns once
+        if entity.type != EntityType.HUMAN:
+            return False
+        entity.zombify()
+        self._record_transformation(entity)
+        self.statistics.record_transformation()
+        return True
+    
     def check_transformations(self, x, y):
         entity_at_pos = None
         for entity in self.entities:
@@ -190,93 +382,124 @@ class GameBoard:
                 break
         
         if entity_at_pos and entity_at_pos.type == EntityType.ZOMBIE:
-            adjacent_positions = [
-                (x-1, y), (x+1, y), (x, y-1), (x, y+1)
-            ]
-            
-            for adj_x, adj_y in adjacent_positions:
-                if self.is_valid_position(adj_x, adj_y):
-                    for entity in self.entities:
-                        if (entity.is_alive and 
-                            entity.type == EntityType.HUMAN and 
-                            entity.position_x == adj_x and 
-                            entity.position_y == adj_y):
-                            entity.zombify()
-                            self.statistics.record_transformation()
+            for adj_x, adj_y in self.topology.neighbours_of(x, y):
+                for entity in self.entities:
+                    if (entity.is_alive and 
+                        entity.type == EntityType.HUMAN and 
+                        entity.position_x == adj_x and 
+                        entity.position_y == adj_y):
+                        if self._transform(entity):
                             self.check_transformations(adj_x, adj_y)
         
         elif entity_at_pos and entity_at_pos.type == EntityType.HUMAN:
-            adjacent_positions = [
-                (x-1, y), (x+1, y), (x, y-1), (x, y+1)
-            ]
-            
-            for adj_x, adj_y in adjacent_positions:
-                if self.is_valid_position(adj_x, adj_y):
-                    for entity in self.entities:
-                        if (entity.is_alive and 
-                            entity.type == EntityType.ZOMBIE and 
-                            entity.position_x == adj_x and 
-                            entity.position_y == adj_y):
-                            entity_at_pos.zombify()
-                            self.statistics.record_transformation()
+            for adj_x, adj_y in self.topology.neighbours_of(x, y):
+                for entity in self.entities:
+                    if (entity.is_alive and 
+                        entity.type == EntityType.ZOMBIE and 
+                        entity.position_x == adj_x and 
+                        entity.position_y == adj_y):
+                        # The first infecting neighbour is enough; the rest of the adjacency is not scanned
+                        if self._transform(entity_at_pos):
                             self.check_transformations(x, y)
-                            break
+                        return
     
     def get_nearby_entities(self, x, y):
-        nearby = []
-        with self.board_lock:
+        neighbours = self.topology.neighbours_of(x, y)
+        
+        def scan():
+            nearby = []
             for entity in self.entities:
-                if entity.is_alive:
-                    distance = abs(entity.position_x - x) + abs(entity.position_y - y)
-                    if distance == 1:
-                        nearby.append(entity)
-        return nearby
+                if entity.is_alive and (entity.position_x, entity.position_y) in neighbours:
+                    nearby.append(entity)
+            return nearby
+        
+        return self.board_lock.read(scan)
     
-    def register_escape(self):
+    def register_escape(self, entity):
+        with self.board_lock.write_locked(), self._board_views_batch():
+            self._record_removal(entity, escaped=True)
         self.statistics.record_escape()
         self.check_win_condition()
     
     def check_win_condition(self):
-        with self.board_lock:
-            humans_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.HUMAN)
-            zombies_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.ZOMBIE)
-            
-            if self.statistics.escapes > 0:
-                self.end_game("HUMANS")
-            elif humans_alive == 0:
-                self.end_game("ZOMBIES")
+        humans_alive = self.board_lock.read(
+            lambda: sum(1 for e in self.entities if e.is_alive and e.type == EntityType.HUMAN)
+        )
+        
+        if self.statistics.escapes > 0:
+            self.end_game("HUMANS")
+        elif humans_alive == 0:
+            self.end_game("ZOMBIES")
     
     def end_game(self, winner):
-        if self.game_ended:
-            return
+        # The game loop, the main thread and entity threads can all end the game; only the first one tears it down
+        with self.end_game_lock:
+            if self.game_ended:
+                return
+            self.game_ended = True
         
-        self.game_ended = True
         self.winner = winner
         
-        humans_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.HUMAN)
-        zombies_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.ZOMBIE)
-        
-        self.statistics.set_final_counts(humans_alive, zombies_alive)
-        
-        self.logger.log(LogEvent.GAME_END, f"Game ended. Winner: {winner}")
-        
-        for entity in self.entities:
-            entity.kill()
-        
-        if self.display:
-            self.display.stop()
-        
-        time.sleep(0.5)
-        
-        if self.display:
-            self.display.show()
-            self.display.show_final_statistics()
-        
-        self.logger.close()
-        
-        for entity in self.entities:
-            entity.join(timeout=1)
-        
-        for condition in self.position_conditions.values():
-            with condition:
-                condition.notify_all()
\ No newline at end of file
+        # Teardown writes files chosen by the user (results database, trace, recording); if one of them fails,
+        # the logger and the shared segment are still released and the game loop waiting on game_finished is let go
+        try:
+            humans_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.HUMAN)
+            zombies_alive = sum(1 for e in self.entities if e.is_alive and e.type == EntityType.ZOMBIE)
+            
+            self.statistics.set_final_counts(humans_alive, zombies_alive)
+            
+            self.logger.log(LogEvent.GAME_END, f"Game ended. Winner: {winner}")
+            
+            if self.shared_state:
+                with self.board_lock.write_locked():
+                    self.shared_state.finish(winner)
+            
+            for entity in self.entities:
+                entity.kill()
+            
+            if self.move_arbiter:
+                self.move_arbiter.stop()
+            
+            if self.display:
+                self.display.stop()
+            
+            time.sleep(0.5)
+            
+            if self.display:
+                if not self.headless:
+                    self.display.show()
+                self.display.show_final_statistics()
+            
+            if self.results_db:
+                configuration = dict(self.configuration, seed=self.seed)
+                record_game_result(self.results_db, configuration, self.statistics.get_statistics(), winner, self.seed)
+            
+            for entity in self.entities:
+                if entity is not threading.current_thread():
+                    entity.join(timeout=1)
+            
+            if self.occupancy_recorder:
+                frames = self.occupancy_recorder.stop()
+                print(f"\nOcupação gravada em {self.occupancy_file} ({frames} frames)")
+            
+            if self.trace_file:
+                self.tracer.write(self.trace_file)
+                dropped = self.tracer.dropped_events()
+                print(f"\nTrace salvo em {self.trace_file}" + (f" ({dropped} eventos antigos descartados)" if dropped else ""))
+        except Exception as e:
+            self.logger.log(LogEvent.ERROR, f"Error while ending the game: {e}")
+            raise
+        finally:
+            self.logger.close()
+            
+            for condition in list(self.position_conditions.values()):
+                with condition:
+                    condition.notify_all()
+            
+            if self.shared_state:
+                with self.board_lock.write_locked():
+                    self.board_views.remove(self.shared_state)
+                    self.shared_state.close()
+                    self.shared_state = None
+            
+            self.game_finished.set()
\ No newline at end of file
@@ -1,12 +1,170 @@
+import math
+import multiprocessing
+import shutil
 import threading
 import time
 import os
+import signal
 from entity import EntityType
+from shared_board_state import SharedBoardReader, CELL_CODES, CELL_HUMAN, CELL_ZOMBIE
+
+CELL_GLYPHS = {CELL_HUMAN: "🧑", CELL_ZOMBIE: "🧟"}
+EMPTY_GLYPH = "⬜"
+
+VIEW_MODES = ('COMPLETO', 'JANELA', 'ZOOM')
+DENSITY_SHADES = " ░▒▓█"
+
+class Viewport:
+    def __init__(self, x_start, y_start, columns, rows, block=1):
+        self.x_start = x_start
+        self.y_start = y_start
+        self.columns = columns
+        self.rows = rows
+        self.block = block
+    
+    def describe(self, board_size):
+        if self.block > 1:
+            return f"Zoom: {self.block}x{self.block} casas por célula"
+        if self.columns < board_size or self.rows < board_size:
+            return (f"Janela: x {self.x_start}-{self.x_start + self.columns - 1}, "
+                    f"y {self.y_start}-{self.y_start + self.rows - 1}")
+        return None
+
+def compute_viewport(view_mode, board_size, focus=None, zoom_factor=0, extra_lines=0):
+    if view_mode == 'COMPLETO':
+        return Viewport(0, 0, board_size, board_size)
+    
+    terminal = shutil.get_terminal_size((120, 40))
+    max_columns = max(1, (terminal.columns - 4) // 2)
+    max_rows = max(1, terminal.lines - FRAME_CHROME_LINES - extra_lines)
+    
+    if view_mode == 'ZOOM':
+        block = zoom_factor or max(math.ceil(board_size / max_columns), math.ceil(board_size / max_rows))
+        cells = math.ceil(board_size / block)
+        return Viewport(0, 0, cells, cells, block)
+    
+    columns = min(board_size, max_columns)
+    rows = min(board_size, max_rows)
+    focus_x, focus_y = focus if focus is not None else (board_size // 2, board_size // 2)
+    x_start = min(max(focus_x - columns // 2, 0), board_size - columns)
+    y_start = min(max(focus_y - rows // 2, 0), board_size - rows)
+    return Viewport(x_start, y_start, columns, rows)
+
+def _block_glyph(humans, zombies, block_area):
+    occupied = humans + zombies
+    if occupied == 0:
+        return "  "
+    marker = "H" if zombies == 0 else "Z" if humans == 0 else "X"
+    shade = DENSITY_SHADES[min(len(DENSITY_SHADES) - 1, math.ceil(4 * occupied / block_area))]
+    return marker + shade
+
+def _format_rows(board_size, cell_at, viewport, occupied):
+    rows = []
+    block = viewport.block
+    
+    if block == 1:
+        x_range = range(viewport.x_start, viewport.x_start + viewport.columns)
+        for y in range(viewport.y_start, viewport.y_start + viewport.rows):
+            row = "".join(CELL_GLYPHS.get(cell_at(x, y), EMPTY_GLYPH) for x in x_range)
+            rows.append(f"{y:2}|{row}|")
+        return rows
+    
+    # Aggregation walks the occupied cells when the source can list them, otherwise the whole board
+    if occupied is None:
+        occupied = (((x, y), cell_at(x, y)) for y in range(board_size) for x in range(board_size))
+    
+    counts = {}
+    for (x, y), cell in occupied:
+        if cell in CELL_GLYPHS:
+            block_counts = counts.setdefault((x // block, y // block), [0, 0])
+            block_counts[0 if cell == CELL_HUMAN else 1] += 1
+    
+    for block_y in range(viewport.rows):
+        row = "".join(
+            _block_glyph(*counts.get((block_x, block_y), (0, 0)), block * block)
+            for block_x in range(viewport.columns)
+        )
+        rows.append(f"{(block_y * block):2}|{row}|")
+    return rows
+
+def format_frame(board_size, cell_at, human_count, zombie_count, escapes, transformations, elapsed, game_ended, winner,
+                 viewport=None, occupied=None):
+    viewport = viewport or Viewport(0, 0, board_size, board_size)
+    
+    lines = [
+        "",
+        "="*60,
+        "ZUMBIS VS HUMANOS",
+        "="*60,
+        "",
+        "   " + "".join(f"{(viewport.x_start + i * viewport.block)%10}" for i in range(viewport.columns)),
+        "  +" + "-"*viewport.columns + "+"
+    ]
+    
+    lines.extend(_format_rows(board_size, cell_at, viewport, occupied))
+    
+    lines.append("  +" + "-"*viewport.columns + "+")
+    
+    description = viewport.describe(board_size)
+    if description:
+        lines.append(description)
+    
+    lines.append(f"\nHumanos: {human_count} | Zumbis: {zombie_count}")
+    lines.append(f"Escaparam: {escapes} | Transformações: {transformations}")
+    lines.append(f"Tempo: {elapsed:.1f}s")
+    
+    status = "EM ANDAMENTO"
+    if game_ended:
+        if winner == "HUMANS":
+            status = "VITÓRIA DOS HUMANOS!"
+        elif winner == "ZOMBIES":
+            status = "VITÓRIA DOS ZUMBIS!"
+        else:
+            status = "EMPATE!"
+    
+    lines.append(f"\nStatus: {status}")
+    lines.append("\nPressione Ctrl+C para interromper o jogo.")
+    return "\n".join(lines)
+
+# Lines format_frame prints around the board rows, measured on a one-row frame with a viewport description,
+# plus the line the cursor lands on after print
+FRAME_CHROME_LINES = format_frame(1, lambda x, y: None, 0, 0, 0, 0, 0.0, False, None,
+                                  viewport=Viewport(0, 0, 1, 1, 2)).count("\n") + 1
+
+def format_shared_frame(frame, view_mode='COMPLETO', zoom_factor=0):
+    focus = frame.front_human() if view_mode == 'JANELA' else None
+    return format_frame(
+        frame.board_size,
+        frame.cell_at,
+        frame.humans,
+        frame.zombies,
+        frame.escapes,
+        frame.transformations,
+        frame.elapsed(),
+        frame.game_ended,
+        frame.winner,
+        viewport=compute_viewport(view_mode, frame.board_size, focus, zoom_factor),
+        occupied=frame.occupied()
+    )
+
+def _run_display_process(shared_state_name, update_rate, stop_event, view_mode, zoom_factor):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    reader = SharedBoardReader(shared_state_name)
+    try:
+        while not stop_event.is_set():
+            frame = reader.read(lambda shared_frame: format_shared_frame(shared_frame, view_mode, zoom_factor))
+            os.system('clear' if os.name == 'posix' else 'cls')
+            print(frame, flush=True)
+            stop_event.wait(update_rate)
+    finally:
+        reader.close()
 
 class GameDisplay:
-    def __init__(self, game_board, update_rate=0.5):
+    def __init__(self, game_board, update_rate=0.5, view_mode='COMPLETO', zoom_factor=0):
         self.game_board = game_board
         self.update_rate = update_rate
+        self.view_mode = view_mode
+        self.zoom_factor = zoom_factor
         self.running = False
         self.display_thread = None
         self.lock = threading.Lock()
@@ -28,65 +186,32 @@ class GameDisplay:
     
     def show(self):
         with self.lock:
-            os.system('clear' if os.name == 'posix' else 'cls')
-            
-            board = [[' ' for _ in range(self.game_board.board_size)] for _ in range(self.game_board.board_size)]
-            
-            human_count = 0
-            zombie_count = 0
-            
-            for entity in self.game_board.entities:
-                if entity.is_alive:
-                    x, y = entity.position_x, entity.position_y
-                    if 0 <= x < self.game_board.board_size and 0 <= y < self.game_board.board_size:
-                        if entity.type == EntityType.HUMAN:
-                            board[y][x] = 'H'
-                            human_count += 1
-                        else:
-                            board[y][x] = 'Z'
-                            zombie_count += 1
-            
-            print("\n" + "="*60)
-            print("ZUMBIS VS HUMANOS")
-            print("="*60)
-            
-            print("\n   ", end="")
-            for i in range(self.game_board.board_size):
-                print(f"{i%10}", end="")
-            print()
-            
-            print("  +" + "-"*self.game_board.board_size + "+")
+            board_size = self.game_board.board_size
+            snapshot = self.game_board.world_snapshot()
             
-            for y in range(self.game_board.board_size):
-                print(f"{y:2}|", end="")
-                for x in range(self.game_board.board_size):
-                    if board[y][x] == 'H':
-                        print("🧑", end="")
-                    elif board[y][x] == 'Z':
-                        print("🧟", end="")
-                    else:
-                        print("⬜", end="")
-                print("|")
-            
-            print("  +" + "-"*self.game_board.board_size + "+")
+            focus = None
+            if self.view_mode == 'JANELA':
+                focus = max(snapshot.positions_of(EntityType.HUMAN), default=None)
+            viewport = compute_viewport(self.view_mode, board_size, focus, self.zoom_factor)
             
             stats = self.game_board.statistics.get_statistics()
             
-            print(f"\nHumanos: {human_count} | Zumbis: {zombie_count}")
-            print(f"Escaparam: {stats['escapes']} | Transformações: {stats['transformations']}")
-            print(f"Tempo: {stats['total_time']:.1f}s")
-            
-            status = "EM ANDAMENTO"
-            if self.game_board.game_ended:
-                if self.game_board.winner == "HUMANS":
-                    status = "VITÓRIA DOS HUMANOS!"
-                elif self.game_board.winner == "ZOMBIES":
-                    status = "VITÓRIA DOS ZUMBIS!"
-                else:
-                    status = "EMPATE!"
+            frame = format_frame(
+                board_size,
+                lambda x, y: CELL_CODES.get(snapshot.entity_type_at(x, y)),
+                snapshot.count(EntityType.HUMAN),
+                snapshot.count(EntityType.ZOMBIE),
+                stats['escapes'],
+                stats['transformations'],
+                stats['total_time'],
+                self.game_board.game_ended,
+                self.game_board.winner,
+                viewport=viewport,
+                occupied=((position, CELL_CODES[entity_type]) for position, entity_type in snapshot.occupied())
+            )
             
-            print(f"\nStatus: {status}")
-            print("\nPressione Ctrl+C para interromper o jogo.")
+            os.system('clear' if os.name == 'posix' else 'cls')
+            print(frame)
     
     def show_final_statistics(self):
         stats = self.game_board.statistics.get_statistics()
@@ -97,6 +222,12 @@ class GameDisplay:
         
         print(f"\nResultado: {self.game_board.winner}")
         print(f"Tempo total: {stats['total_time']:.2f} segundos")
+        print(f"Semente: {self.game_board.seed}")
+        
+        if stats['startup_latency'] is not None:
+            print(f"Latência de inicialização: {stats['startup_latency'] * 1000:.1f} ms")
+        if stats['time_to_first_move'] is not None:
+            print(f"Tempo até o primeiro movimento: {stats['time_to_first_move'] * 1000:.1f} ms")
         
         print(f"\nContagem inicial: {stats['initial_humans']} humanos, {stats['initial_zombies']} zumbis")
         print(f"Contagem final: {stats['final_humans']} humanos, {stats['final_zombies']} zumbis")
@@ -104,6 +235,7 @@ class GameDisplay:
         print(f"\nHumanos que escaparam: {stats['escapes']}")
         print(f"Transformações: {stats['transformations']}")
         print(f"Colisões: {stats['collisions']}")
+        print(f"Deadlocks resolvidos: {stats['deadlocks']}")
         
         print(f"\nMovimentos totais:")
         for entity_type, count in stats['total_moves'].items():
@@ -115,4 +247,26 @@ class GameDisplay:
         if stats['most_used_positions']:
             print(f"\nPosições mais ocupadas:")
             for pos, count in stats['most_used_positions'][:5]:
-                print(f"  {pos}: {count} vezes")
\ No newline at end of file
+                print(f"  {pos}: {count} vezes")
+
+class GameDisplayProcess(GameDisplay):
+    def __init__(self, game_board, shared_state_name, update_rate=0.5, view_mode='COMPLETO', zoom_factor=0):
+        super().__init__(game_board, update_rate, view_mode, zoom_factor)
+        self.shared_state_name = shared_state_name
+        self.stop_event = multiprocessing.Event()
+        self.display_process = None
+    
+    def start(self):
+        self.running = True
+        self.display_process = multiprocessing.Process(
+            target=_run_display_process,
+            args=(self.shared_state_name, self.update_rate, self.stop_event, self.view_mode, self.zoom_factor),
+            daemon=True
+        )
+        self.display_process.start()
+    
+    def stop(self):
+        self.running = False
+        self.stop_event.set()
+        if self.display_process:
+            self.display_process.join(timeout=1)
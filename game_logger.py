@@ -2,6 +2,7 @@ import threading
 import time
 from datetime import datetime
 from enum import Enum
+from trace_recorder import TraceRecorder
 
 class LogEvent(Enum):
     MOVE_EXECUTED = "MOVE_EXECUTED"
@@ -12,6 +13,7 @@ class LogEvent(Enum):
     GAME_START = "GAME_START"
     GAME_END = "GAME_END"
     ESCAPE = "ESCAPE"
+    DEADLOCK_RESOLVED = "DEADLOCK_RESOLVED"
     ERROR = "ERROR"
 
 class GameLogger:
@@ -28,20 +30,23 @@ class GameLogger:
     def __init__(self):
         if not hasattr(self, 'initialized'):
             self.log_file = None
+            self.log_handle = None
             self.file_lock = threading.Lock()
             self.show_realtime_logs = False
+            self.tracer = TraceRecorder()
             self.initialized = True
     
     def initialize(self, log_file="game_log.txt", show_realtime_logs=False):
         with self.file_lock:
             self.log_file = log_file
             self.show_realtime_logs = show_realtime_logs
-            with open(self.log_file, 'w') as f:
-                f.write(f"Game Log Started: {datetime.now()}\n")
-                f.write("="*80 + "\n")
+            # The handle stays open for the whole game instead of reopening the file per event
+            self.log_handle = open(self.log_file, 'w')
+            self.log_handle.write(f"Game Log Started: {datetime.now()}\n")
+            self.log_handle.write("="*80 + "\n")
     
     def log(self, event_type, message, entity_id=None, entity_type=None):
-        with self.file_lock:
+        with self.tracer.span("log", "logger", {'event': event_type.value}), self.file_lock:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             log_entry = f"[{timestamp}] [{event_type.value}]"
             
@@ -52,9 +57,8 @@ class GameLogger:
             
             log_entry += f" {message}"
             
-            if self.log_file:
-                with open(self.log_file, 'a') as f:
-                    f.write(log_entry + "\n")
+            if self.log_handle:
+                self.log_handle.write(log_entry + "\n")
             
             # Somente exibe o log se a opção estiver habilitada
             if self.show_realtime_logs:
@@ -62,7 +66,8 @@ class GameLogger:
     
     def close(self):
         with self.file_lock:
-            if self.log_file:
-                with open(self.log_file, 'a') as f:
-                    f.write("="*80 + "\n")
-                    f.write(f"Game Log Ended: {datetime.now()}\n")
\ No newline at end of file
+            if self.log_handle:
+                self.log_handle.write("="*80 + "\n")
+                self.log_handle.write(f"Game Log Ended: {datetime.now()}\n")
+                self.log_handle.close()
+                self.log_handle = None
\ No newline at end of file
@@ -12,6 +12,7 @@ class GameStatistics:
         self.transformations = 0
         self.escapes = 0
         self.collisions = 0
+        self.deadlocks = 0
         self.position_usage = defaultdict(int)
         self.human_survival_times = []
         self.move_times = []
@@ -21,10 +22,29 @@ class GameStatistics:
         self.final_humans = 0
         self.final_zombies = 0
         
+        self.launch_time = None
+        self.ready_time = None
+        self.first_move_time = None
+    
+    def record_launch(self):
+        with self.lock:
+            self.launch_time = time.time()
+    
+    def record_ready(self):
+        with self.lock:
+            self.ready_time = time.time()
+    
+    def record_first_move(self):
+        with self.lock:
+            if self.first_move_time is None:
+                self.first_move_time = time.time()
+    
     def record_move(self, entity_type, position):
         with self.lock:
             self.total_moves[entity_type] += 1
             self.position_usage[position] += 1
+            if self.first_move_time is None:
+                self.first_move_time = time.time()
     
     def record_transformation(self):
         with self.lock:
@@ -38,6 +58,10 @@ class GameStatistics:
         with self.lock:
             self.collisions += 1
     
+    def record_deadlock(self):
+        with self.lock:
+            self.deadlocks += 1
+    
     def record_human_death(self, survival_time):
         with self.lock:
             self.human_survival_times.append(survival_time)
@@ -57,6 +81,32 @@ class GameStatistics:
             self.final_zombies = zombies
             self.end_time = time.time()
     
+    def get_counters(self):
+        with self.lock:
+            return {
+                'total_moves': dict(self.total_moves),
+                'transformations': self.transformations,
+                'escapes': self.escapes,
+                'collisions': self.collisions,
+                'deadlocks': self.deadlocks,
+                'position_usage': dict(self.position_usage),
+                'human_survival_times': list(self.human_survival_times),
+                'move_times': list(self.move_times)
+            }
+    
+    def merge_counters(self, counters):
+        with self.lock:
+            for entity_type, count in counters['total_moves'].items():
+                self.total_moves[entity_type] += count
+            for position, count in counters['position_usage'].items():
+                self.position_usage[position] += count
+            self.transformations += counters['transformations']
+            self.escapes += counters['escapes']
+            self.collisions += counters['collisions']
+            self.deadlocks += counters['deadlocks']
+            self.human_survival_times.extend(counters['human_survival_times'])
+            self.move_times.extend(counters['move_times'])
+    
     def get_statistics(self):
         with self.lock:
             total_time = (self.end_time or time.time()) - self.start_time
@@ -69,8 +119,18 @@ class GameStatistics:
                 reverse=True
             )[:10]
             
+            startup_latency = None
+            time_to_first_move = None
+            if self.launch_time is not None:
+                if self.ready_time is not None:
+                    startup_latency = self.ready_time - self.launch_time
+                if self.first_move_time is not None:
+                    time_to_first_move = self.first_move_time - self.launch_time
+            
             return {
                 'total_time': total_time,
+                'startup_latency': startup_latency,
+                'time_to_first_move': time_to_first_move,
                 'initial_humans': self.initial_humans,
                 'initial_zombies': self.initial_zombies,
                 'final_humans': self.final_humans,
@@ -79,6 +139,7 @@ class GameStatistics:
                 'transformations': self.transformations,
                 'total_moves': dict(self.total_moves),
                 'collisions': self.collisions,
+                'deadlocks': self.deadlocks,
                 'avg_human_survival': avg_survival,
                 'avg_move_time': avg_move_time,
                 'most_used_positions': most_used_positions
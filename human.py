@@ -9,24 +9,39 @@ class Human(Entity):
         if self.actual_state != EntityState.MOVING or not self.is_alive:
             return None, None
         
-        directions = []
+        if self.game_board.human_movement_strategy == "FUGA":
+            return self._escape_movement()
+        return self._directional_movement()
+    
+    def _directional_movement(self):
+        topology = self.game_board.topology
         
         if self.game_board.human_movement_bias_enabled:
             bias = self.game_board.human_movement_bias
             if random.random() < bias:
-                if self.position_x < self.game_board.board_size - 1:
-                    return self.position_x + 1, self.position_y
-        
-        if self.position_x > 0:
-            directions.append((self.position_x - 1, self.position_y))
-        if self.position_x < self.game_board.board_size - 1:
-            directions.append((self.position_x + 1, self.position_y))
-        if self.position_y > 0:
-            directions.append((self.position_x, self.position_y - 1))
-        if self.position_y < self.game_board.board_size - 1:
-            directions.append((self.position_x, self.position_y + 1))
+                forward = topology.step(self.position_x, self.position_y, 1, 0)
+                if forward:
+                    return forward
+        
+        directions = topology.neighbours_of(self.position_x, self.position_y)
         
         if directions:
             return random.choice(directions)
         
-        return None, None
\ No newline at end of file
+        return None, None
+    
+    def _escape_movement(self):
+        field = self.game_board.escape_field
+        snapshot = self.game_board.world_snapshot()
+        
+        # Occupied cells are skipped so the human never queues behind a blocked position
+        free_cells = [
+            (x, y) for x, y in self.game_board.topology.neighbours_of(self.position_x, self.position_y)
+            if snapshot.entity_type_at(x, y) is None
+        ]
+        
+        if not free_cells:
+            return None, None
+        
+        best_distance = min(field.distance_at(x, y) for x, y in free_cells)
+        return random.choice([cell for cell in free_cells if field.distance_at(*cell) == best_distance])
\ No newline at end of file
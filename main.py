@@ -1,5 +1,6 @@
 import sys
 from game_board import GameBoard
+from stripe_simulation import StripeCoordinator
 from args_parser import parse_arguments
 
 def main():
@@ -14,15 +15,23 @@ def main():
     print(f"  Zumbis: {args.zombies}")
     print(f"  Cooldown: {args.cooldown_min}s - {args.cooldown_max}s")
     print(f"  Timeout: {'Sem limite' if args.game_timeout == 0 else f'{args.game_timeout}s'}")
+    print(f"  Estratégia Humana: {args.human_strategy}")
     print(f"  Estratégia Zumbi: {args.zombie_strategy}")
+    print(f"  Vizinhança: {args.neighbourhood}{' (toroidal)' if args.toroidal else ''}")
     print(f"  Bias Humano: {'Desabilitado' if args.no_human_bias else args.human_bias}")
+    print(f"  Processos: {'Threads (1 processo)' if args.workers == 1 else f'{args.workers} faixas'}")
+    print(f"  Semente: {'Aleatória' if args.seed is None else args.seed}")
+    if args.results_db:
+        print(f"  Banco de resultados: {args.results_db}")
     print(f"  Log em tempo real: {'Habilitado' if args.enable_realtime_logger else 'Desabilitado'}")
-    print("\nIniciando jogo em 3 segundos...")
     
-    import time
-    time.sleep(3)
+    # The countdown only makes sense when someone is watching the board
+    if not args.headless and args.workers == 1 and sys.stdout.isatty():
+        print("\nIniciando jogo em 3 segundos...")
+        import time
+        time.sleep(3)
     
-    game = GameBoard()
+    game = GameBoard() if args.workers == 1 else StripeCoordinator(args.workers)
     game.configure(
         board_size=args.board_size,
         humans_amount=args.humans,
@@ -33,10 +42,25 @@ def main():
         position_wait_timeout=args.position_wait_timeout,
         human_movement_bias_enabled=not args.no_human_bias,
         human_movement_bias=args.human_bias,
+        human_movement_strategy=args.human_strategy,
         zombie_movement_strategy=args.zombie_strategy,
         zombie_persecution_range=args.zombie_range,
+        neighbourhood=args.neighbourhood,
+        toroidal=args.toroidal,
         display_update_rate=args.display_rate,
-        show_realtime_logs=args.enable_realtime_logger
+        view_mode=args.view_mode,
+        zoom_factor=args.zoom_factor,
+        show_realtime_logs=args.enable_realtime_logger,
+        shared_state_enabled=args.shared_state,
+        display_process=args.display_process,
+        headless=args.headless,
+        fast_start=args.fast_start,
+        move_arbiter_enabled=args.move_arbiter,
+        trace_file=args.trace,
+        occupancy_file=args.occupancy_file,
+        occupancy_interval=args.occupancy_interval,
+        seed=args.seed,
+        results_db=args.results_db
     )
     
     try:
@@ -0,0 +1,136 @@
+import queue
+import threading
+from concurrent.futures import Future
+from game_logger import LogEvent
+from trace_recorder import TraceRecorder
+
+class MoveIntent:
+    __slots__ = ('entity', 'target', 'future')
+    
+    def __init__(self, entity, target):
+        self.entity = entity
+        self.target = target
+        self.future = Future()
+
+class MoveArbiter:
+    def __init__(self, game_board, batch_size=256):
+        self.game_board = game_board
+        self.batch_size = batch_size
+        self.intents = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.running = False
+        self.arbiter_thread = None
+    
+    def start(self):
+        self.running = True
+        self.arbiter_thread = threading.Thread(target=self._run, name="MoveArbiter", daemon=True)
+        self.arbiter_thread.start()
+    
+    def stop(self):
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            self.intents.put(None)
+        self.arbiter_thread.join(timeout=1)
+    
+    def submit(self, entity, new_x, new_y):
+        intent = MoveIntent(entity, (new_x, new_y))
+        with self.lock:
+            if self.running:
+                self.intents.put(intent)
+                return intent.future
+        intent.future.set_result(False)
+        return intent.future
+    
+    def _run(self):
+        while True:
+            intent = self.intents.get()
+            if intent is None:
+                break
+            
+            batch = [intent]
+            while len(batch) < self.batch_size:
+                try:
+                    intent = self.intents.get_nowait()
+                except queue.Empty:
+                    break
+                if intent is None:
+                    self._resolve(batch)
+                    return
+                batch.append(intent)
+            
+            self._resolve(batch)
+    
+    def _resolve(self, batch):
+        with TraceRecorder().span("batch", "arbiter", {'intents': len(batch)}):
+            try:
+                self._resolve_batch(batch)
+            except Exception as e:
+                # A failed batch must not take the arbiter down: its entities would wait on their futures forever
+                self.game_board.logger.log(LogEvent.ERROR, f"Arbiter failed to resolve a batch of {len(batch)} intents: {e}")
+                for intent in batch:
+                    if not intent.future.done():
+                        intent.future.set_result(False)
+    
+    def _resolve_batch(self, batch):
+        board = self.game_board
+        moved = []
+        rejected = []
+        
+        # Deterministic priority: the lowest entity id wins a contested cell
+        batch.sort(key=lambda intent: intent.entity.id)
+        
+        with board.board_lock.write_locked(), board._board_views_batch():
+            snapshot = board.world_snapshot()
+            # Cells vacated or taken earlier in the batch shadow the snapshot, which is republished only afterwards
+            owners = {}
+            claimed = set()
+            pending = []
+            
+            for intent in batch:
+                if board.game_ended or not intent.entity.is_alive or intent.target in claimed:
+                    rejected.append(intent)
+                else:
+                    claimed.add(intent.target)
+                    pending.append(intent)
+            
+            # A move out of a cell can unblock another move into it within the same batch
+            progress = True
+            while pending and progress:
+                progress = False
+                blocked = []
+                for intent in pending:
+                    owner = owners[intent.target] if intent.target in owners else snapshot.owner_at(*intent.target)
+                    if owner is not None:
+                        blocked.append(intent)
+                        continue
+                    
+                    entity = intent.entity
+                    old_position = entity.get_position()
+                    owners[old_position] = None
+                    owners[intent.target] = entity.id
+                    entity.position_x, entity.position_y = intent.target
+                    board._record_move(entity, old_position, intent.target)
+                    moved.append(intent)
+                    progress = True
+                pending = blocked
+            
+            rejected.extend(pending)
+            
+            for intent in moved:
+                board.check_transformations(*intent.target)
+        
+        for intent in moved:
+            board.statistics.record_move(intent.entity.type.value, intent.target)
+            intent.future.set_result(True)
+        
+        for intent in rejected:
+            board.statistics.record_collision()
+            board.logger.log(
+                LogEvent.MOVE_DISCARDED,
+                f"Movement rejected by arbiter: ({intent.entity.position_x},{intent.entity.position_y}) -> {intent.target}",
+                intent.entity.id,
+                intent.entity.type.value
+            )
+            intent.future.set_result(False)
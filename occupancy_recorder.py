@@ -0,0 +1,230 @@
+import argparse
+import mmap
+import os
+import struct
+import threading
+import time
+from entity import EntityState
+from shared_board_state import CELL_CODES, CELL_EMPTY, CELL_HUMAN, CELL_ZOMBIE
+from game_display import compute_viewport, format_frame, VIEW_MODES, DENSITY_SHADES
+
+# Cell codes are bit flags: the entity type from the shared board state plus a waiting bit
+CELL_WAITING = 4
+CELL_KINDS = {'HUMANOS': CELL_HUMAN, 'ZUMBIS': CELL_ZOMBIE, 'ESPERA': CELL_WAITING}
+
+# Layout: magic, board_size, capacity, frames_written, interval, start_time | capacity x N x N bytes
+MAGIC = b'ZVHO'
+HEADER = struct.Struct('<4sIIIdd')
+FRAMES_WRITTEN = struct.Struct('<I')
+FRAMES_WRITTEN_OFFSET = 12
+DEFAULT_DURATION = 3600
+
+class OccupancyRecorder:
+    def __init__(self, game_board, path, interval=0.1):
+        self.game_board = game_board
+        self.path = path
+        self.interval = interval
+        self.board_size = game_board.board_size
+        self.cells = self.board_size * self.board_size
+        
+        duration = game_board.game_timeout if game_board.game_timeout > 0 else DEFAULT_DURATION
+        self.capacity = int(duration / interval) + 2
+        self.frames_written = 0
+        self.start_time = time.time()
+        
+        # The file is sized up front for the expected game length; untouched frames stay sparse on disk until sampled
+        self.file = open(path, 'w+b')
+        self._map_frames()
+        
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.sampler_thread = None
+    
+    def _map_frames(self):
+        self.file.truncate(HEADER.size + self.capacity * self.cells)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        HEADER.pack_into(self.map, 0, MAGIC, self.board_size, self.capacity, self.frames_written,
+                         self.interval, self.start_time)
+        self.frames = memoryview(self.map)[HEADER.size:]
+    
+    def _grow(self):
+        # A game that outlasts the reservation doubles the file, so remaps stay rare and no frame is dropped
+        self.frames.release()
+        self.map.close()
+        self.capacity *= 2
+        self._map_frames()
+    
+    def start(self):
+        self.sampler_thread = threading.Thread(target=self._run, name="OccupancySampler", daemon=True)
+        self.sampler_thread.start()
+    
+    def _run(self):
+        next_sample = time.monotonic()
+        while not self.stop_event.wait(max(0.0, next_sample - time.monotonic())):
+            if not self.sample():
+                break
+            next_sample += self.interval
+    
+    def sample(self):
+        with self.lock:
+            if self.frames is None:
+                return False
+            if self.frames_written >= self.capacity:
+                self._grow()
+            
+            board_size = self.board_size
+            offset = self.frames_written * self.cells
+            frame = self.frames[offset:offset + self.cells]
+            
+            # Frames start zeroed, so a sample only writes the occupied cells in place
+            for (x, y), entity_type in self.game_board.world_snapshot().occupied():
+                frame[y * board_size + x] = CELL_CODES[entity_type]
+            for entity in list(self.game_board.entities):
+                if entity.is_alive and entity.actual_state == EntityState.WAITING:
+                    index = entity.position_y * board_size + entity.position_x
+                    frame[index] |= CELL_WAITING
+            frame.release()
+            
+            self.frames_written += 1
+            FRAMES_WRITTEN.pack_into(self.map, FRAMES_WRITTEN_OFFSET, self.frames_written)
+            return True
+    
+    def stop(self):
+        self.stop_event.set()
+        if self.sampler_thread:
+            self.sampler_thread.join(timeout=1)
+        self.sample()
+        
+        with self.lock:
+            frames_written = self.frames_written
+            HEADER.pack_into(self.map, 0, MAGIC, self.board_size, frames_written, frames_written,
+                             self.interval, self.start_time)
+            self.frames.release()
+            self.frames = None
+            self.map.flush()
+            self.map.close()
+            # Frames that were never sampled are trimmed away
+            self.file.truncate(HEADER.size + frames_written * self.cells)
+            self.file.close()
+        return frames_written
+
+class OccupancyRecording:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.board_size, self.capacity, self.frames_written, self.interval, self.start_time = \
+            HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an occupancy recording")
+        self.cells = self.board_size * self.board_size
+        self.frames = memoryview(self.map)[HEADER.size:HEADER.size + self.frames_written * self.cells]
+    
+    def __len__(self):
+        return self.frames_written
+    
+    def window(self, start, end):
+        # A zero-copy view shaped (time, y, x); only the pages actually read are loaded from disk
+        start, end, _ = slice(start, end).indices(self.frames_written)
+        if end <= start:
+            # memoryview cannot take a shape with a zero dimension, so an empty window stays flat
+            return self.frames[0:0]
+        return self.frames[start * self.cells:end * self.cells].cast('B', (end - start, self.board_size, self.board_size))
+    
+    def frame(self, index):
+        return self.frames[index * self.cells:(index + 1) * self.cells]
+    
+    def heatmap(self, start, end, mask):
+        start, end, _ = slice(start, end).indices(self.frames_written)
+        table = bytes(1 if code & mask else 0 for code in range(256))
+        totals = [0] * self.cells
+        lanes = 0
+        lane_frames = 0
+        
+        # Each frame becomes one big integer with a byte lane per cell, so the per-frame sum runs in C;
+        # lanes are drained into the totals before a byte can overflow
+        for index in range(start, end):
+            lanes += int.from_bytes(self.frame(index).tobytes().translate(table), 'little')
+            lane_frames += 1
+            if lane_frames == 255 or index == end - 1:
+                for cell, count in enumerate(lanes.to_bytes(self.cells, 'little')):
+                    totals[cell] += count
+                lanes = 0
+                lane_frames = 0
+        return totals
+    
+    def close(self):
+        if hasattr(self, 'frames'):
+            self.frames.release()
+        self.map.close()
+        self.file.close()
+
+def _format_recorded_frame(recording, index, view_mode, zoom_factor):
+    frame = recording.frame(index)
+    content = frame.tobytes()
+    frame.release()
+    humans = sum(content.count(bytes([code])) for code in (CELL_HUMAN, CELL_HUMAN | CELL_WAITING))
+    zombies = sum(content.count(bytes([code])) for code in (CELL_ZOMBIE, CELL_ZOMBIE | CELL_WAITING))
+    board_size = recording.board_size
+    
+    return format_frame(
+        board_size,
+        lambda x, y: content[y * board_size + x] & (CELL_HUMAN | CELL_ZOMBIE) or CELL_EMPTY,
+        humans,
+        zombies,
+        0,
+        0,
+        index * recording.interval,
+        False,
+        None,
+        viewport=compute_viewport(view_mode, board_size, None, zoom_factor, extra_lines=1)
+    )
+
+def _print_heatmap(recording, start, end, kind):
+    totals = recording.heatmap(start, end, CELL_KINDS[kind])
+    frames = max(1, len(range(*slice(start, end).indices(len(recording)))))
+    board_size = recording.board_size
+    
+    print(f"Ocupação ({kind.lower()}) por casa, frames {start or 0} a {end if end is not None else len(recording)}")
+    for y in range(board_size):
+        row = "".join(
+            DENSITY_SHADES[min(len(DENSITY_SHADES) - 1, -(-4 * totals[y * board_size + x] // frames))] * 2
+            for x in range(board_size)
+        )
+        print(f"{y:2}|{row}|")
+
+def main():
+    parser = argparse.ArgumentParser(description='Reprodução e mapa de calor de uma gravação de ocupação')
+    parser.add_argument('recording', help='Arquivo gerado com --occupancy-file')
+    parser.add_argument('--start', type=int, default=None, help='Primeiro frame da janela (padrão: início)')
+    parser.add_argument('--end', type=int, default=None, help='Frame final da janela, exclusivo (padrão: fim)')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Intervalo entre frames na reprodução em segundos (padrão: o intervalo da gravação)')
+    parser.add_argument('--view-mode', type=str, default='COMPLETO', choices=VIEW_MODES,
+                        help='Modo de exibição do tabuleiro (padrão: COMPLETO)')
+    parser.add_argument('--zoom-factor', type=int, default=0, help='Casas agregadas por célula no modo ZOOM')
+    parser.add_argument('--heatmap', type=str, default=None, choices=list(CELL_KINDS),
+                        help='Em vez de reproduzir, mostra o mapa de calor da janela para humanos, zumbis ou esperas')
+    args = parser.parse_args()
+    
+    recording = OccupancyRecording(args.recording)
+    try:
+        print(f"Gravação {recording.board_size}x{recording.board_size}, {len(recording)} frames "
+              f"a cada {recording.interval}s")
+        if args.heatmap:
+            _print_heatmap(recording, args.start, args.end, args.heatmap)
+            return
+        
+        rate = args.rate if args.rate is not None else recording.interval
+        for index in range(*slice(args.start, args.end).indices(len(recording))):
+            os.system('clear' if os.name == 'posix' else 'cls')
+            print(_format_recorded_frame(recording, index, args.view_mode, args.zoom_factor))
+            print(f"Frame {index + 1}/{len(recording)}")
+            time.sleep(rate)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recording.close()
+
+if __name__ == "__main__":
+    main()
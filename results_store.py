@@ -0,0 +1,188 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    seed INTEGER,
+    winner TEXT NOT NULL,
+    duration REAL NOT NULL,
+    zombie_strategy TEXT,
+    board_size INTEGER,
+    humans INTEGER,
+    zombies INTEGER,
+    workers INTEGER,
+    initial_humans INTEGER,
+    initial_zombies INTEGER,
+    final_humans INTEGER,
+    final_zombies INTEGER,
+    escapes INTEGER,
+    transformations INTEGER,
+    collisions INTEGER,
+    deadlocks INTEGER,
+    human_moves INTEGER,
+    zombie_moves INTEGER,
+    avg_human_survival REAL,
+    avg_move_time REAL,
+    startup_latency REAL,
+    time_to_first_move REAL,
+    configuration TEXT NOT NULL,
+    statistics TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_parameters (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_by_strategy ON runs (zombie_strategy, winner, duration, transformations);
+CREATE INDEX IF NOT EXISTS runs_by_population ON runs (board_size, humans, zombies);
+CREATE INDEX IF NOT EXISTS runs_by_winner ON runs (winner);
+CREATE INDEX IF NOT EXISTS parameters_by_value ON run_parameters (name, value, run_id);
+"""
+
+RUN_COLUMNS = (
+    'recorded_at', 'seed', 'winner', 'duration', 'zombie_strategy', 'board_size', 'humans', 'zombies', 'workers',
+    'initial_humans', 'initial_zombies', 'final_humans', 'final_zombies', 'escapes', 'transformations',
+    'collisions', 'deadlocks', 'human_moves', 'zombie_moves', 'avg_human_survival', 'avg_move_time',
+    'startup_latency', 'time_to_first_move', 'configuration', 'statistics'
+)
+
+INSERT_RUN = f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) VALUES ({', '.join('?' for _ in RUN_COLUMNS)})"
+INSERT_PARAMETER = "INSERT INTO run_parameters (run_id, name, value) VALUES (?, ?, ?)"
+
+GROUP_COLUMNS = ('zombie_strategy', 'board_size', 'humans', 'zombies', 'workers', 'winner')
+
+def _parameter_value(value):
+    # SQLite stores ints, floats and text natively; anything else is kept as its JSON form
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return json.dumps(value, default=str)
+
+class ResultsStore:
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.lock = threading.Lock()
+        
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+    
+    def record(self, configuration, statistics, winner, seed=None):
+        moves = statistics['total_moves']
+        run = (
+            time.time(),
+            seed,
+            winner,
+            statistics['total_time'],
+            configuration.get('zombie_movement_strategy'),
+            configuration.get('board_size'),
+            configuration.get('humans_amount'),
+            configuration.get('zombies_amount'),
+            configuration.get('workers', 1),
+            statistics['initial_humans'],
+            statistics['initial_zombies'],
+            statistics['final_humans'],
+            statistics['final_zombies'],
+            statistics['escapes'],
+            statistics['transformations'],
+            statistics['collisions'],
+            statistics['deadlocks'],
+            moves.get('HUMAN', 0),
+            moves.get('ZOMBIE', 0),
+            statistics['avg_human_survival'],
+            statistics['avg_move_time'],
+            statistics['startup_latency'],
+            statistics['time_to_first_move'],
+            json.dumps(configuration, default=str, sort_keys=True),
+            json.dumps(statistics, default=str)
+        )
+        parameters = [(name, _parameter_value(value)) for name, value in sorted(configuration.items())]
+        
+        with self.lock:
+            self.pending.append((run, parameters))
+            should_flush = len(self.pending) >= self.batch_size
+        if should_flush:
+            self.flush()
+    
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+            if not pending:
+                return
+            
+            # One transaction per batch: a sweep pays a single WAL commit for hundreds of runs
+            with self.connection:
+                for run, parameters in pending:
+                    run_id = self.connection.execute(INSERT_RUN, run).lastrowid
+                    self.connection.executemany(
+                        INSERT_PARAMETER,
+                        [(run_id, name, value) for name, value in parameters]
+                    )
+    
+    def close(self):
+        self.flush()
+        self.connection.close()
+    
+    def summary(self, group_by='zombie_strategy', **parameters):
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown grouping column: {group_by}")
+        
+        # Each parameter filter is answered from the (name, value) index of run_parameters
+        filters = []
+        values = []
+        for name, value in parameters.items():
+            filters.append("id IN (SELECT run_id FROM run_parameters WHERE name = ? AND value = ?)")
+            values.extend((name, _parameter_value(value)))
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        
+        query = f"""
+            SELECT {group_by},
+                   COUNT(*),
+                   SUM(winner = 'HUMANS'),
+                   SUM(winner = 'ZOMBIES'),
+                   SUM(winner = 'TIMEOUT'),
+                   AVG(duration),
+                   AVG(transformations)
+            FROM runs {where}
+            GROUP BY {group_by}
+            ORDER BY {group_by}
+        """
+        return self.connection.execute(query, values).fetchall()
+
+def record_game_result(path, configuration, statistics, winner, seed):
+    # A game from the command line writes a single run, so it pays one transaction; batching only helps
+    # scripts that keep one ResultsStore open and record many runs through it
+    store = ResultsStore(path)
+    try:
+        store.record(configuration, statistics, winner, seed)
+    finally:
+        store.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Resumo das partidas gravadas no banco de resultados')
+    parser.add_argument('database', help='Arquivo SQLite gerado com --results-db')
+    parser.add_argument('--group-by', choices=GROUP_COLUMNS, default='zombie_strategy',
+                        help='Coluna usada para agrupar as partidas (padrão: zombie_strategy)')
+    args = parser.parse_args()
+    
+    store = ResultsStore(args.database)
+    started = time.perf_counter()
+    rows = store.summary(args.group_by)
+    elapsed = time.perf_counter() - started
+    store.close()
+    
+    print(f"{args.group_by:<20}{'Partidas':>10}{'Humanos':>10}{'Zumbis':>10}{'Timeout':>10}{'Duração':>10}{'Transf.':>10}")
+    for group, runs, humans, zombies, timeouts, duration, transformations in rows:
+        print(f"{str(group):<20}{runs:>10}{humans:>10}{zombies:>10}{timeouts:>10}{duration:>9.1f}s{transformations:>10.1f}")
+    print(f"\nConsulta executada em {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
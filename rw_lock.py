@@ -0,0 +1,74 @@
+import threading
+from contextlib import contextmanager
+
+class ReadWriteLock:
+    def __init__(self):
+        self.mutex = threading.Lock()
+        self.readers_ok = threading.Condition(self.mutex)
+        self.writers_ok = threading.Condition(self.mutex)
+        self.readers = 0
+        self.readers_waiting = 0
+        self.writer_active = False
+        self.writers_waiting = 0
+    
+    def acquire_read(self):
+        with self.mutex:
+            # Writer preference: new readers queue behind any waiting writer
+            while self.writer_active or self.writers_waiting:
+                self.readers_waiting += 1
+                self.readers_ok.wait()
+                self.readers_waiting -= 1
+            self.readers += 1
+    
+    def release_read(self):
+        with self.mutex:
+            self.readers -= 1
+            # Only the last reader out wakes anyone, and only a single writer
+            if self.readers == 0 and self.writers_waiting:
+                self.writers_ok.notify()
+    
+    def acquire_write(self):
+        with self.mutex:
+            self.writers_waiting += 1
+            while self.writer_active or self.readers:
+                self.writers_ok.wait()
+            self.writers_waiting -= 1
+            self.writer_active = True
+    
+    def release_write(self):
+        with self.mutex:
+            self.writer_active = False
+            if self.writers_waiting:
+                self.writers_ok.notify()
+            elif self.readers_waiting:
+                self.readers_ok.notify_all()
+    
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    def read(self, reader):
+        self.acquire_read()
+        try:
+            return reader()
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+    
+    def __enter__(self):
+        self.acquire_write()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release_write()
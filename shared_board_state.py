@@ -0,0 +1,192 @@
+import re
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from entity import EntityType
+
+CELL_EMPTY = 0
+CELL_HUMAN = 1
+CELL_ZOMBIE = 2
+
+CELL_CODES = {
+    EntityType.HUMAN: CELL_HUMAN,
+    EntityType.ZOMBIE: CELL_ZOMBIE
+}
+
+WINNER_CODES = {None: 0, "HUMANS": 1, "ZOMBIES": 2, "TIMEOUT": 3, "INTERRUPTED": 4, "ERROR": 5}
+WINNERS = {code: winner for winner, code in WINNER_CODES.items()}
+
+# Layout: sequence | board_size, humans, zombies, escapes, transformations, winner, start_time, end_time | cells
+#         | occupied cells per row | humans per column
+SEQUENCE = struct.Struct('<Q')
+HEADER = struct.Struct('<IIIIIIdd')
+CELLS_OFFSET = SEQUENCE.size + HEADER.size
+COUNTER_SIZE = struct.calcsize('I')
+OCCUPIED_CELL = re.compile(b'[^\x00]')
+
+def _segment_views(buffer, board_size):
+    cells_end = CELLS_OFFSET + board_size * board_size
+    rows_end = cells_end + board_size * COUNTER_SIZE
+    return (
+        buffer[CELLS_OFFSET:cells_end],
+        buffer[cells_end:rows_end].cast('I'),
+        buffer[rows_end:rows_end + board_size * COUNTER_SIZE].cast('I')
+    )
+
+class SharedBoardFrame:
+    def __init__(self, header, cells, row_population, column_humans):
+        (self.board_size, self.humans, self.zombies, self.escapes,
+         self.transformations, winner_code, self.start_time, self.end_time) = header
+        self.winner = WINNERS[winner_code]
+        self.game_ended = winner_code != 0
+        self.cells = cells
+        self.row_population = row_population
+        self.column_humans = column_humans
+    
+    def cell_at(self, x, y):
+        return self.cells[y * self.board_size + x]
+    
+    def occupied(self):
+        # Empty rows are skipped by their published population; inside a row the search runs in C
+        board_size = self.board_size
+        for y, population in enumerate(self.row_population):
+            if population:
+                row = self.cells[y * board_size:(y + 1) * board_size].tobytes()
+                for match in OCCUPIED_CELL.finditer(row):
+                    yield (match.start(), y), row[match.start()]
+    
+    def front_human(self):
+        # The rightmost column holding a human comes from the published counts, then one strided column scan
+        for x in range(self.board_size - 1, -1, -1):
+            if self.column_humans[x]:
+                y = self.cells[x::self.board_size].tobytes().find(CELL_HUMAN)
+                return (x, y) if y >= 0 else None
+        return None
+    
+    def elapsed(self):
+        return (self.end_time or time.time()) - self.start_time
+
+class SharedBoardState:
+    def __init__(self, board_size):
+        self.board_size = board_size
+        size = CELLS_OFFSET + board_size * board_size + 2 * board_size * COUNTER_SIZE
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self.shm.name
+        self.cells, self.row_population, self.column_humans = _segment_views(self.shm.buf, board_size)
+        
+        self.humans = 0
+        self.zombies = 0
+        self.escapes = 0
+        self.transformations = 0
+        self.winner = None
+        self.start_time = time.time()
+        self.end_time = 0.0
+        
+        self._sequence = 0
+        self._write_depth = 0
+        
+        self.shm.buf[CELLS_OFFSET:size] = bytes(size - CELLS_OFFSET)
+        self._publish_header()
+    
+    def _publish_header(self):
+        HEADER.pack_into(
+            self.shm.buf, SEQUENCE.size,
+            self.board_size, self.humans, self.zombies, self.escapes,
+            self.transformations, WINNER_CODES.get(self.winner, 0), self.start_time, self.end_time
+        )
+    
+    @contextmanager
+    def write(self):
+        # Seqlock: an odd sequence tells readers a frame is being written
+        self._write_depth += 1
+        if self._write_depth == 1:
+            self._sequence += 1
+            SEQUENCE.pack_into(self.shm.buf, 0, self._sequence)
+        try:
+            yield
+        finally:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._publish_header()
+                self._sequence += 1
+                SEQUENCE.pack_into(self.shm.buf, 0, self._sequence)
+    
+    def _index(self, position):
+        return position[1] * self.board_size + position[0]
+    
+    def _adjust_count(self, entity_type, delta):
+        if entity_type == EntityType.HUMAN:
+            self.humans += delta
+        else:
+            self.zombies += delta
+    
+    def _set_cell(self, entity_type, position, delta):
+        x, y = position
+        self.cells[self._index(position)] = CELL_CODES[entity_type] if delta > 0 else CELL_EMPTY
+        self.row_population[y] += delta
+        if entity_type == EntityType.HUMAN:
+            self.column_humans[x] += delta
+    
+    def place(self, entity, position):
+        with self.write():
+            self._set_cell(entity.type, position, 1)
+            self._adjust_count(entity.type, 1)
+    
+    def move(self, entity, old_position, new_position):
+        with self.write():
+            self._set_cell(entity.type, old_position, -1)
+            self._set_cell(entity.type, new_position, 1)
+    
+    def transform(self, entity, position):
+        with self.write():
+            self._set_cell(EntityType.HUMAN, position, -1)
+            self._set_cell(EntityType.ZOMBIE, position, 1)
+            self.humans -= 1
+            self.zombies += 1
+            self.transformations += 1
+    
+    def remove(self, entity, position, escaped=False):
+        with self.write():
+            self._set_cell(entity.type, position, -1)
+            self._adjust_count(entity.type, -1)
+            if escaped:
+                self.escapes += 1
+    
+    def finish(self, winner):
+        with self.write():
+            self.winner = winner
+            self.end_time = time.time()
+    
+    def close(self):
+        self.cells.release()
+        self.row_population.release()
+        self.column_humans.release()
+        self.shm.close()
+        self.shm.unlink()
+
+class SharedBoardReader:
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name=name)
+    
+    def read(self, consumer):
+        buffer = self.shm.buf
+        while True:
+            sequence = SEQUENCE.unpack_from(buffer, 0)[0]
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            
+            header = HEADER.unpack_from(buffer, SEQUENCE.size)
+            views = _segment_views(buffer, header[0])
+            try:
+                result = consumer(SharedBoardFrame(header, *views))
+            finally:
+                for view in views:
+                    view.release()
+            
+            if SEQUENCE.unpack_from(buffer, 0)[0] == sequence:
+                return result
+    
+    def close(self):
+        self.shm.close()
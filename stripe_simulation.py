@@ -0,0 +1,449 @@
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import threading
+import time
+from entity import EntityType
+from human import Human
+from zombie import Zombie
+from game_logger import GameLogger, LogEvent
+from game_statistics import GameStatistics
+from game_display import GameDisplay
+from world_snapshot import WorldSnapshotPublisher
+from results_store import record_game_result
+from board_topology import BoardTopology
+
+LEFT = 0
+RIGHT = 1
+REPORT_POLL_INTERVAL = 0.5
+
+class StripeBoard:
+    def __init__(self, index, x_start, x_end, config, links):
+        self.board_size = 50
+        self.cooldown_min = 0.5
+        self.cooldown_max = 2.0
+        self.human_movement_bias_enabled = True
+        self.human_movement_bias = 0.6
+        self.human_movement_strategy = "DIRECIONAL"
+        self.zombie_movement_strategy = "ALEATORIO"
+        self.zombie_persecution_range = 3
+        self.neighbourhood = "ORTOGONAL"
+        self.toroidal = False
+        self.headless = False
+        self.fast_start = False
+        for key, value in config.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+        
+        self.topology = BoardTopology(self.board_size, self.neighbourhood, self.toroidal)
+        
+        self.index = index
+        self.x_start = x_start
+        self.x_end = x_end
+        self.links = links
+        
+        self.entities = []
+        self.cells = {}
+        self.next_move_tick = {}
+        self.ghosts = [{}, {}]
+        self.snapshots = WorldSnapshotPublisher()
+        self.game_ended = False
+        self.statistics = GameStatistics()
+    
+    def populate(self, entity_specs):
+        for spec in entity_specs:
+            self._add_entity(spec)
+    
+    def _cooldown_ticks(self):
+        cooldown = random.uniform(self.cooldown_min, self.cooldown_max)
+        return max(1, round(cooldown / self.cooldown_min))
+    
+    def _add_entity(self, spec):
+        entity_id, entity_type, x, y, next_tick = spec
+        entity_class = Human if entity_type == EntityType.HUMAN.value else Zombie
+        entity = entity_class(x, y)
+        entity.id = entity_id
+        entity.set_game_board(self)
+        self.entities.append(entity)
+        self.cells[(x, y)] = entity
+        self.snapshots.place(entity, (x, y))
+        if next_tick is None:
+            next_tick = self._cooldown_ticks()
+            if self.fast_start or self.headless:
+                next_tick = random.randint(0, next_tick)
+        self.next_move_tick[entity_id] = next_tick
+        return entity
+    
+    def _remove_entity(self, entity):
+        entity.kill()
+        self.entities.remove(entity)
+        del self.cells[(entity.position_x, entity.position_y)]
+        self.snapshots.remove(entity, entity.get_position())
+        return self.next_move_tick.pop(entity.id)
+    
+    def _spec(self, entity, x, y):
+        return (entity.id, entity.type.value, x, y, self.next_move_tick[entity.id])
+    
+    def _contains(self, x):
+        return self.x_start <= x < self.x_end
+    
+    def _send(self, side, message):
+        if self.links[side] is not None:
+            self.links[side][1].put(message)
+    
+    def _receive(self, side):
+        if self.links[side] is None:
+            return None
+        return self.links[side][0].get()
+    
+    def world_snapshot(self):
+        return self.snapshots.current
+    
+    def run_tick(self, tick):
+        # Strategies read the snapshot published at the end of the previous tick
+        with self.snapshots.write():
+            self._exchange_ghosts()
+            self._spread_infections()
+            outgoing = self._move_entities(tick)
+            self._exchange_migrants(outgoing)
+            self._collect_escapes()
+    
+    def _edge_column(self, x):
+        return {y: entity.type.value for (cx, y), entity in self.cells.items() if cx == x}
+    
+    def _exchange_ghosts(self):
+        self._send(LEFT, self._edge_column(self.x_start))
+        self._send(RIGHT, self._edge_column(self.x_end - 1))
+        self.ghosts = [self._receive(LEFT) or {}, self._receive(RIGHT) or {}]
+    
+    def _type_at(self, x, y):
+        if self._contains(x):
+            entity = self.cells.get((x, y))
+            return entity.type.value if entity else None
+        if x == self.x_start - 1:
+            return self.ghosts[LEFT].get(y)
+        if x == self.x_end:
+            return self.ghosts[RIGHT].get(y)
+        return None
+    
+    def _is_exposed(self, x, y):
+        for adj_x, adj_y in self.topology.neighbours_of(x, y):
+            if self._type_at(adj_x, adj_y) == EntityType.ZOMBIE.value:
+                return True
+        return False
+    
+    def _spread_infections(self):
+        pending = [e for e in self.entities if e.type == EntityType.HUMAN and self._is_exposed(e.position_x, e.position_y)]
+        while pending:
+            human = pending.pop()
+            if human.type != EntityType.HUMAN or not human.is_alive:
+                continue
+            x, y = human.position_x, human.position_y
+            next_tick = self._remove_entity(human)
+            self._add_entity((human.id, EntityType.ZOMBIE.value, x, y, next_tick))
+            self.statistics.record_transformation()
+            for adj in self.topology.neighbours_of(x, y):
+                neighbour = self.cells.get(adj)
+                if neighbour and neighbour.type == EntityType.HUMAN:
+                    pending.append(neighbour)
+    
+    def _move_entities(self, tick):
+        outgoing = [[], []]
+        order = list(self.entities)
+        random.shuffle(order)
+        
+        for entity in order:
+            if self.next_move_tick[entity.id] > tick:
+                continue
+            self.next_move_tick[entity.id] = tick + self._cooldown_ticks()
+            
+            next_x, next_y = entity.calculate_next_movement()
+            if next_x is None or next_y is None:
+                continue
+            if not (0 <= next_x < self.board_size and 0 <= next_y < self.board_size):
+                continue
+            
+            if not self._contains(next_x):
+                side = LEFT if next_x < self.x_start else RIGHT
+                outgoing[side].append((entity, next_x, next_y))
+                continue
+            
+            if (next_x, next_y) in self.cells:
+                self.statistics.record_collision()
+                continue
+            
+            old_position = entity.get_position()
+            del self.cells[old_position]
+            entity.position_x, entity.position_y = next_x, next_y
+            self.cells[(next_x, next_y)] = entity
+            self.snapshots.move(entity, old_position, (next_x, next_y))
+            self.statistics.record_move(entity.type.value, (next_x, next_y))
+        
+        return outgoing
+    
+    def _exchange_migrants(self, outgoing):
+        for side in (LEFT, RIGHT):
+            self._send(side, [self._spec(entity, x, y) for entity, x, y in outgoing[side]])
+        
+        for side in (LEFT, RIGHT):
+            incoming = self._receive(side)
+            if incoming is None:
+                continue
+            accepted = []
+            for spec in incoming:
+                entity_id, entity_type, x, y, _ = spec
+                if (x, y) in self.cells:
+                    continue
+                self._add_entity(spec)
+                self.statistics.record_move(entity_type, (x, y))
+                accepted.append(entity_id)
+            self._send(side, accepted)
+        
+        for side in (LEFT, RIGHT):
+            accepted = self._receive(side)
+            if accepted is None:
+                continue
+            accepted = set(accepted)
+            for entity, _, _ in outgoing[side]:
+                if entity.id in accepted:
+                    self._remove_entity(entity)
+                else:
+                    self.statistics.record_collision()
+    
+    def _collect_escapes(self):
+        if not self._contains(self.board_size - 1):
+            return
+        for entity in list(self.entities):
+            if entity.type == EntityType.HUMAN and entity.position_x == self.board_size - 1:
+                self._remove_entity(entity)
+                self.statistics.record_escape()
+    
+    def report(self):
+        humans = sum(1 for e in self.entities if e.type == EntityType.HUMAN)
+        zombies = len(self.entities) - humans
+        return (self.index, humans, zombies, self.statistics.escapes)
+
+def _run_stripe_worker(index, x_start, x_end, config, entity_specs, links, control_queue, report_queue):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    random.seed(config['seed'] + index + 1)
+    
+    stripe = StripeBoard(index, x_start, x_end, config, links)
+    stripe.populate(entity_specs)
+    
+    tick = 0
+    while True:
+        stripe.run_tick(tick)
+        report_queue.put(stripe.report())
+        if not control_queue.get():
+            break
+        tick += 1
+    
+    report_queue.put((index, stripe.statistics.get_counters()))
+
+class StripeCoordinator:
+    def __init__(self, workers):
+        self.workers = workers
+        self.board_size = 50
+        self.humans_amount = 50
+        self.zombies_amount = 10
+        self.cooldown_min = 0.5
+        self.game_timeout = 300
+        self.display_update_rate = 0.5
+        self.show_realtime_logs = False
+        self.seed = None
+        self.results_db = None
+        self.config = {}
+        
+        self.game_ended = False
+        self.winner = None
+        self.start_time = None
+        self.ticks = 0
+        self.processes = []
+        self.control_queues = []
+        self.report_queue = None
+        self.game_thread = None
+        
+        self.logger = GameLogger()
+        self.statistics = GameStatistics()
+    
+    def configure(self, **kwargs):
+        self.config.update(kwargs)
+        for key, value in kwargs.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+    
+    def stripe_bounds(self):
+        return [
+            (self.board_size * i // self.workers, self.board_size * (i + 1) // self.workers)
+            for i in range(self.workers)
+        ]
+    
+    def _place_entities(self, bounds):
+        specs = [[] for _ in bounds]
+        
+        def stripe_of(x):
+            for index, (x_start, x_end) in enumerate(bounds):
+                if x_start <= x < x_end:
+                    return index
+        
+        human_rows = list(range(self.board_size))
+        zombie_rows = list(range(self.board_size))
+        random.shuffle(human_rows)
+        random.shuffle(zombie_rows)
+        
+        entity_id = 0
+        for y in human_rows[:self.humans_amount]:
+            specs[stripe_of(0)].append((entity_id, EntityType.HUMAN.value, 0, y, None))
+            entity_id += 1
+        for y in zombie_rows[:self.zombies_amount]:
+            specs[stripe_of(self.board_size - 1)].append((entity_id, EntityType.ZOMBIE.value, self.board_size - 1, y, None))
+            entity_id += 1
+        
+        return specs
+    
+    def start_game(self):
+        self.statistics.record_launch()
+        
+        logs_dir = "logs"
+        os.makedirs(logs_dir, exist_ok=True)
+        
+        log_file_path = os.path.join(logs_dir, f"game_log_{int(time.time())}.txt")
+        self.logger.initialize(log_file_path, self.show_realtime_logs)
+        self.logger.log(
+            LogEvent.GAME_START,
+            f"Game started with {self.humans_amount} humans and {self.zombies_amount} zombies on {self.workers} stripe workers"
+        )
+        
+        if self.seed is None:
+            self.seed = random.randrange(2**32)
+        random.seed(self.seed)
+        self.config['seed'] = self.seed
+        self.logger.log(LogEvent.GAME_START, f"Random seed: {self.seed}")
+        
+        bounds = self.stripe_bounds()
+        specs = self._place_entities(bounds)
+        self.statistics.set_initial_counts(self.humans_amount, self.zombies_amount)
+        
+        context = multiprocessing.get_context()
+        boundaries = [(context.Queue(), context.Queue()) for _ in range(self.workers - 1)]
+        self.report_queue = context.Queue()
+        self.control_queues = [context.Queue() for _ in range(self.workers)]
+        
+        for index, (x_start, x_end) in enumerate(bounds):
+            # Each boundary has one queue per direction: (left-to-right, right-to-left)
+            left = (boundaries[index - 1][0], boundaries[index - 1][1]) if index > 0 else None
+            right = (boundaries[index][1], boundaries[index][0]) if index < self.workers - 1 else None
+            process = context.Process(
+                target=_run_stripe_worker,
+                args=(index, x_start, x_end, self.config, specs[index], [left, right],
+                      self.control_queues[index], self.report_queue),
+                daemon=True
+            )
+            self.processes.append(process)
+        
+        self.start_time = time.time()
+        for process in self.processes:
+            process.start()
+        self.statistics.record_ready()
+        
+        self.game_thread = threading.Thread(target=self._game_loop)
+        self.game_thread.start()
+        
+        return self.game_thread
+    
+    def _check_win_condition(self, humans_alive, escapes):
+        if escapes > 0:
+            return "HUMANS"
+        if humans_alive == 0:
+            return "ZOMBIES"
+        # Ticks run unpaced, so the timeout is measured in game time rather than wall-clock time
+        if self.game_timeout > 0 and self.ticks * self.cooldown_min >= self.game_timeout:
+            return "TIMEOUT"
+        return None
+    
+    def _collect_reports(self):
+        # A worker that dies never reports, so the queue is polled and the workers checked in between
+        reports = []
+        while len(reports) < len(self.processes):
+            try:
+                reports.append(self.report_queue.get(timeout=REPORT_POLL_INTERVAL))
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in self.processes):
+                    return None
+        return reports
+    
+    def _abort_workers(self):
+        failed = [index for index, process in enumerate(self.processes) if process.exitcode not in (None, 0)]
+        self.logger.log(LogEvent.GAME_END, f"Stripe workers {failed} exited unexpectedly, stopping the game")
+        print(f"\nErro: os processos das faixas {failed} terminaram inesperadamente")
+        
+        # Surviving workers may be blocked on a neighbour that will never answer
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        self.game_ended = True
+        self.winner = "ERROR"
+    
+    def _game_loop(self):
+        last_status = 0
+        humans_alive = zombies_alive = 0
+        
+        while True:
+            reports = self._collect_reports()
+            if reports is None:
+                break
+            self.statistics.record_first_move()
+            humans_alive = sum(report[1] for report in reports)
+            zombies_alive = sum(report[2] for report in reports)
+            escapes = sum(report[3] for report in reports)
+            self.ticks += 1
+            
+            winner = self._check_win_condition(humans_alive, escapes)
+            if winner and not self.game_ended:
+                self.game_ended = True
+                self.winner = winner
+            if self.game_ended:
+                break
+            
+            if time.time() - last_status >= self.display_update_rate:
+                last_status = time.time()
+                print(f"Tick {self.ticks} | Humanos: {humans_alive} | Zumbis: {zombies_alive} | "
+                      f"Tempo de jogo: {self.ticks * self.cooldown_min:.1f}s | "
+                      f"Tempo real: {last_status - self.start_time:.1f}s")
+            
+            for control_queue in self.control_queues:
+                control_queue.put(True)
+        
+        if reports is not None:
+            for control_queue in self.control_queues:
+                control_queue.put(False)
+            reports = self._collect_reports()
+        
+        if reports is None:
+            self._abort_workers()
+        else:
+            for _, counters in reports:
+                self.statistics.merge_counters(counters)
+        
+        for process in self.processes:
+            process.join()
+        
+        self.statistics.set_final_counts(humans_alive, zombies_alive)
+        self.logger.log(LogEvent.GAME_END, f"Game ended after {self.ticks} ticks. Winner: {self.winner}")
+        self.logger.close()
+        
+        GameDisplay(self).show_final_statistics()
+        
+        if self.results_db:
+            configuration = dict(self.config, workers=self.workers)
+            record_game_result(self.results_db, configuration, self.statistics.get_statistics(), self.winner, self.seed)
+    
+    def end_game(self, winner):
+        if not self.game_ended:
+            self.game_ended = True
+            self.winner = winner
+        
+        if self.game_thread and threading.current_thread() is not self.game_thread:
+            self.game_thread.join()
@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+class _Span:
+    __slots__ = ('buffer', 'name', 'category', 'args', 'start')
+    
+    def __init__(self, buffer, name, category, args):
+        self.buffer = buffer
+        self.name = name
+        self.category = category
+        self.args = args
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.buffer.record((self.name, self.category, self.start, time.perf_counter_ns(), self.args))
+
+class _NullSpan:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _ThreadBuffer:
+    __slots__ = ('tid', 'name', 'events', 'recorded')
+    
+    def __init__(self, tid, name, capacity):
+        self.tid = tid
+        self.name = name
+        self.events = deque(maxlen=capacity)
+        self.recorded = 0
+    
+    def record(self, event):
+        # Only the owning thread appends, so the ring buffer needs no lock
+        self.events.append(event)
+        self.recorded += 1
+
+class TraceRecorder:
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.enabled = False
+            self.buffer_capacity = 65536
+            self.buffers = []
+            self.buffers_lock = threading.Lock()
+            self.local = threading.local()
+            self.origin = time.perf_counter_ns()
+            self.initialized = True
+    
+    def initialize(self, enabled=False, buffer_capacity=65536):
+        with self.buffers_lock:
+            self.enabled = enabled
+            self.buffer_capacity = buffer_capacity
+            self.buffers = []
+            self.local = threading.local()
+            self.origin = time.perf_counter_ns()
+    
+    def _buffer(self):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            with self.buffers_lock:
+                buffer = _ThreadBuffer(len(self.buffers) + 1, threading.current_thread().name, self.buffer_capacity)
+                self.buffers.append(buffer)
+            self.local.buffer = buffer
+        return buffer
+    
+    def span(self, name, category, args=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self._buffer(), name, category, args)
+    
+    def dropped_events(self):
+        with self.buffers_lock:
+            return sum(buffer.recorded - len(buffer.events) for buffer in self.buffers)
+    
+    def write(self, path):
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'Zumbis vs Humanos'}}]
+        
+        with self.buffers_lock:
+            buffers = list(self.buffers)
+        
+        for buffer in buffers:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': buffer.tid, 'args': {'name': buffer.name}})
+            events.append({'name': 'thread_sort_index', 'ph': 'M', 'pid': pid, 'tid': buffer.tid, 'args': {'sort_index': buffer.tid}})
+            
+            # Each span is stored once as a complete event, which survives ring buffer overwrites without unmatched begins
+            for name, category, start, end, args in list(buffer.events):
+                event = {
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'ts': (start - self.origin) / 1000,
+                    'dur': (end - start) / 1000,
+                    'pid': pid,
+                    'tid': buffer.tid
+                }
+                if args:
+                    event['args'] = args
+                events.append(event)
+        
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+        
+        return len(events)
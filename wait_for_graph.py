@@ -0,0 +1,53 @@
+import threading
+import time
+
+class WaitForGraph:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiting_on = {}
+        self.wait_targets = {}
+        self.wait_started = {}
+        self.aborted = set()
+    
+    def wait(self, waiter_id, owner_id, position):
+        with self.lock:
+            if waiter_id in self.aborted:
+                return None
+            if waiter_id not in self.wait_started:
+                self.wait_started[waiter_id] = time.monotonic()
+            self.waiting_on[waiter_id] = owner_id
+            self.wait_targets[waiter_id] = position
+            
+            cycle = self._find_cycle(waiter_id)
+            if cycle is None:
+                return None
+            
+            # The waiter that started waiting last is the cheapest to abort
+            victim_id = max(cycle, key=lambda entity_id: self.wait_started[entity_id])
+            self.aborted.add(victim_id)
+            del self.waiting_on[victim_id]
+            return victim_id, self.wait_targets[victim_id], cycle
+    
+    def _find_cycle(self, start_id):
+        # Every waiter has a single outgoing edge, so a cycle through start_id is a plain walk
+        path = [start_id]
+        current_id = self.waiting_on.get(start_id)
+        while current_id is not None:
+            if current_id == start_id:
+                return path
+            if current_id in path:
+                return None
+            path.append(current_id)
+            current_id = self.waiting_on.get(current_id)
+        return None
+    
+    def is_aborted(self, waiter_id):
+        with self.lock:
+            return waiter_id in self.aborted
+    
+    def release(self, waiter_id):
+        with self.lock:
+            self.waiting_on.pop(waiter_id, None)
+            self.wait_targets.pop(waiter_id, None)
+            self.wait_started.pop(waiter_id, None)
+            self.aborted.discard(waiter_id)
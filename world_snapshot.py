@@ -0,0 +1,134 @@
+from contextlib import contextmanager
+from types import MappingProxyType
+from entity import EntityType
+
+class WorldSnapshot:
+    __slots__ = ('version', 'rows', 'columns', 'counts')
+    
+    def __init__(self, version, rows, columns, counts):
+        # rows maps y to {x: (entity_type, owner_id)}; columns maps each type to {y: frozenset of x}
+        self.version = version
+        self.rows = MappingProxyType(rows)
+        self.columns = MappingProxyType(columns)
+        self.counts = MappingProxyType(counts)
+    
+    def _cell(self, x, y):
+        row = self.rows.get(y)
+        return row.get(x) if row else None
+    
+    def entity_type_at(self, x, y):
+        cell = self._cell(x, y)
+        return cell[0] if cell else None
+    
+    def owner_at(self, x, y):
+        cell = self._cell(x, y)
+        return cell[1] if cell else None
+    
+    def occupied(self):
+        for y, row in self.rows.items():
+            for x, (entity_type, _) in row.items():
+                yield (x, y), entity_type
+    
+    def positions_of(self, entity_type):
+        for y, xs in self.columns[entity_type].items():
+            for x in xs:
+                yield x, y
+    
+    def count(self, entity_type):
+        return self.counts[entity_type]
+
+EMPTY_SNAPSHOT = WorldSnapshot(
+    0,
+    {},
+    {entity_type: MappingProxyType({}) for entity_type in EntityType},
+    {entity_type: 0 for entity_type in EntityType}
+)
+
+def _merge(previous, changed, freeze):
+    merged = dict(previous)
+    for key, value in changed.items():
+        if value:
+            merged[key] = freeze(value)
+        else:
+            merged.pop(key, None)
+    return merged
+
+class WorldSnapshotPublisher:
+    def __init__(self):
+        self.current = EMPTY_SNAPSHOT
+        self._pending = []
+        self._write_depth = 0
+    
+    @contextmanager
+    def write(self):
+        self._write_depth += 1
+        try:
+            yield
+        finally:
+            self._write_depth -= 1
+            if self._write_depth == 0 and self._pending:
+                self._publish()
+    
+    def place(self, entity, position):
+        with self.write():
+            self._pending.append((entity.id, entity.type, None, position))
+    
+    def move(self, entity, old_position, new_position):
+        with self.write():
+            self._pending.append((entity.id, entity.type, old_position, new_position))
+    
+    def transform(self, entity, position):
+        with self.write():
+            self._pending.append((entity.id, EntityType.HUMAN, position, None))
+            self._pending.append((entity.id, EntityType.ZOMBIE, None, position))
+    
+    def remove(self, entity, position, escaped=False):
+        with self.write():
+            self._pending.append((entity.id, entity.type, position, None))
+    
+    def _publish(self):
+        # Copy-on-write per row: a commit copies the row indexes and only the rows its deltas touch,
+        # so publishing costs O(board size) whatever the population
+        previous = self.current
+        rows = {}
+        columns = {}
+        counts = dict(previous.counts)
+        
+        def row(y):
+            if y not in rows:
+                rows[y] = dict(previous.rows.get(y, {}))
+            return rows[y]
+        
+        def column(entity_type, y):
+            changed = columns.setdefault(entity_type, {})
+            if y not in changed:
+                changed[y] = set(previous.columns[entity_type].get(y, ()))
+            return changed[y]
+        
+        for entity_id, entity_type, old_position, new_position in self._pending:
+            if old_position is not None:
+                x, y = old_position
+                cells = row(y)
+                cell = cells.get(x)
+                if cell is not None and cell[1] == entity_id:
+                    del cells[x]
+                    column(cell[0], y).discard(x)
+                    counts[cell[0]] -= 1
+            if new_position is not None:
+                x, y = new_position
+                row(y)[x] = (entity_type, entity_id)
+                column(entity_type, y).add(x)
+                counts[entity_type] += 1
+        
+        self._pending = []
+        
+        all_columns = dict(previous.columns)
+        for entity_type, changed in columns.items():
+            all_columns[entity_type] = MappingProxyType(_merge(previous.columns[entity_type], changed, frozenset))
+        
+        self.current = WorldSnapshot(
+            previous.version + 1,
+            _merge(previous.rows, rows, MappingProxyType),
+            all_columns,
+            counts
+        )
@@ -22,16 +22,7 @@ class Zombie(Entity):
             return self._random_movement()
     
     def _random_movement(self):
-        directions = []
-        
-        if self.position_x > 0:
-            directions.append((self.position_x - 1, self.position_y))
-        if self.position_x < self.game_board.board_size - 1:
-            directions.append((self.position_x + 1, self.position_y))
-        if self.position_y > 0:
-            directions.append((self.position_x, self.position_y - 1))
-        if self.position_y < self.game_board.board_size - 1:
-            directions.append((self.position_x, self.position_y + 1))
+        directions = self.game_board.topology.neighbours_of(self.position_x, self.position_y)
         
         if directions:
             return random.choice(directions)
@@ -45,20 +36,13 @@ class Zombie(Entity):
             return self._random_movement()
         
         human_x, human_y = nearest_human
-        dx = human_x - self.position_x
-        dy = human_y - self.position_y
-        
-        moves = []
-        
-        if dx > 0 and self.position_x < self.game_board.board_size - 1:
-            moves.append((self.position_x + 1, self.position_y))
-        elif dx < 0 and self.position_x > 0:
-            moves.append((self.position_x - 1, self.position_y))
+        topology = self.game_board.topology
+        distance = topology.distance(self.position_x, self.position_y, human_x, human_y)
         
-        if dy > 0 and self.position_y < self.game_board.board_size - 1:
-            moves.append((self.position_x, self.position_y + 1))
-        elif dy < 0 and self.position_y > 0:
-            moves.append((self.position_x, self.position_y - 1))
+        moves = [
+            (x, y) for x, y in topology.neighbours_of(self.position_x, self.position_y)
+            if topology.distance(x, y, human_x, human_y) < distance
+        ]
         
         if moves:
             return random.choice(moves)
@@ -74,15 +58,7 @@ class Zombie(Entity):
         best_move = None
         best_score = -1
         
-        possible_moves = []
-        if self.position_x > 0:
-            possible_moves.append((self.position_x - 1, self.position_y))
-        if self.position_x < self.game_board.board_size - 1:
-            possible_moves.append((self.position_x + 1, self.position_y))
-        if self.position_y > 0:
-            possible_moves.append((self.position_x, self.position_y - 1))
-        if self.position_y < self.game_board.board_size - 1:
-            possible_moves.append((self.position_x, self.position_y + 1))
+        possible_moves = self.game_board.topology.neighbours_of(self.position_x, self.position_y)
         
         for move in possible_moves:
             score = 0
@@ -101,23 +77,23 @@ class Zombie(Entity):
     def _find_nearest_human(self):
         min_distance = float('inf')
         nearest = None
+        topology = self.game_board.topology
         
-        for entity in self.game_board.entities:
-            if entity.type == EntityType.HUMAN and entity.is_alive:
-                distance = abs(entity.position_x - self.position_x) + abs(entity.position_y - self.position_y)
-                if distance <= self.game_board.zombie_persecution_range and distance < min_distance:
-                    min_distance = distance
-                    nearest = (entity.position_x, entity.position_y)
+        for human_x, human_y in self.game_board.world_snapshot().positions_of(EntityType.HUMAN):
+            distance = topology.distance(self.position_x, self.position_y, human_x, human_y)
+            if distance <= self.game_board.zombie_persecution_range and distance < min_distance:
+                min_distance = distance
+                nearest = (human_x, human_y)
         
         return nearest
     
     def _find_humans_in_range(self):
         humans = []
+        topology = self.game_board.topology
         
-        for entity in self.game_board.entities:
-            if entity.type == EntityType.HUMAN and entity.is_alive:
-                distance = abs(entity.position_x - self.position_x) + abs(entity.position_y - self.position_y)
-                if distance <= self.game_board.zombie_persecution_range:
-                    humans.append((entity.position_x, entity.position_y))
+        for human_x, human_y in self.game_board.world_snapshot().positions_of(EntityType.HUMAN):
+            distance = topology.distance(self.position_x, self.position_y, human_x, human_y)
+            if distance <= self.game_board.zombie_persecution_range:
+                humans.append((human_x, human_y))
         
         return humans
\ No newline at end of file